@@ -0,0 +1,194 @@
+"""lxml-backed ARXML reading on top of ``autosar.xml.reader``.
+
+The upstream reader tokenizes with ``xml.etree.ElementTree``. This adapter
+parses with lxml (libxml2) instead and hands every root ``AR-PACKAGE`` to the
+upstream per-package parser, so the resulting AUTOSAR objects are identical.
+"""
+
+from __future__ import annotations
+
+from typing import BinaryIO, Iterator
+
+from lxml import etree
+
+import autosar.xml.element as ar_element
+import autosar.xml.reader as ar_reader
+
+# pylint: disable=line-too-long
+
+# iterparse tag filters: match in any namespace, or none.
+_AR_PACKAGE_MATCH = "{*}AR-PACKAGE"
+_SHORT_NAME_MATCH = "{*}SHORT-NAME"
+
+
+def _make_parser() -> etree.XMLParser:
+    """Creates an lxml parser configured for ARXML input.
+
+    Blank text is kept on purpose: ARXML documentation blocks are mixed
+    content, where whitespace-only runs between inline tags are significant.
+
+    Args:
+        None.
+
+    Returns:
+        A new ``lxml.etree.XMLParser``.
+    """
+    return etree.XMLParser(huge_tree=True, remove_comments=True, remove_pis=True, collect_ids=False)
+
+
+def _strip_namespace(xml_elem: etree._Element) -> None:
+    """Removes the namespace part from all tags of an element subtree.
+
+    The upstream reader matches bare tag names, so namespaces must go before
+    an element is handed to it.
+
+    Args:
+        xml_elem: Root of the subtree to update in place.
+
+    Returns:
+        None.
+    """
+    for node in xml_elem.iter():
+        tag = node.tag
+        if isinstance(tag, str) and tag[0] == "{":
+            node.tag = tag.split("}", 1)[1]
+
+
+class LxmlReader(ar_reader.Reader):
+    """ARXML reader that parses with lxml and reuses the upstream package parser."""
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Returns whether the installed reader exposes the per-package hook.
+
+        Args:
+            None.
+
+        Returns:
+            True if ``autosar.xml.reader.Reader`` has ``_read_package``.
+        """
+        return hasattr(ar_reader.Reader, "_read_package")
+
+    @staticmethod
+    def parse(data: bytes) -> etree._Element:
+        """Tokenizes an in-memory ARXML document into a namespace-free tree.
+
+        Touches no reader state, so it is safe to call from worker threads;
+        libxml2 releases the GIL while it parses.
+
+        Args:
+            data: Complete ARXML file content.
+
+        Returns:
+            Root ``AUTOSAR`` element with namespaces stripped.
+        """
+        xml_root = etree.fromstring(data, parser=_make_parser())
+        _strip_namespace(xml_root)
+        return xml_root
+
+    @staticmethod
+    def parse_file(file_path: str) -> etree._Element:
+        """Reads an ARXML file in one chunk and tokenizes it.
+
+        Args:
+            file_path: Path to an ARXML file.
+
+        Returns:
+            Root ``AUTOSAR`` element with namespaces stripped.
+
+        Raises:
+            FileNotFoundError: If ``file_path`` does not exist.
+        """
+        with open(file_path, "rb") as xml_file:
+            return LxmlReader.parse(xml_file.read())
+
+    @staticmethod
+    def iter_root_package_names(source: str | BinaryIO) -> Iterator[str]:
+        """Lists the root package names of an ARXML file without building packages.
+
+        Only tokenizes the file: no AUTOSAR objects are created, and each root
+        ``AR-PACKAGE`` subtree is dropped once it ends.
+
+        Args:
+            source: Path to an ARXML file, or a binary file object opened on one.
+
+        Returns:
+            Iterator over the root package short names, in document order.
+        """
+        context = etree.iterparse(
+            source,
+            events=("end",),
+            tag=(_SHORT_NAME_MATCH, _AR_PACKAGE_MATCH),
+            huge_tree=True,
+            remove_comments=True,
+            remove_pis=True,
+            collect_ids=False,
+        )
+        for _, xml_elem in context:
+            parent = xml_elem.getparent()
+            if etree.QName(xml_elem).localname == "SHORT-NAME":
+                # SHORT-NAME -> AR-PACKAGE -> AR-PACKAGES -> AUTOSAR root.
+                if etree.QName(parent).localname == "AR-PACKAGE" and parent.getparent().getparent().getparent() is None:
+                    yield xml_elem.text
+            elif parent is not None and parent.getparent().getparent() is None:
+                xml_elem.clear()
+                while xml_elem.getprevious() is not None:
+                    del parent[0]
+
+    def read_tree(self, xml_root: etree._Element) -> list[ar_element.Package]:
+        """Builds the root packages of a tree returned by :meth:`parse`.
+
+        Args:
+            xml_root: Namespace-free root ``AUTOSAR`` element.
+
+        Returns:
+            List of the parsed root packages, in document order.
+        """
+        return [
+            self._read_package(xml_package)
+            for xml_package in xml_root.iterfind("AR-PACKAGES/AR-PACKAGE")
+        ]
+
+    def read_packages(self, data: bytes) -> list[ar_element.Package]:
+        """Parses the root packages of an in-memory ARXML document.
+
+        Args:
+            data: Complete ARXML file content.
+
+        Returns:
+            List of the parsed root packages, in document order.
+        """
+        return self.read_tree(self.parse(data))
+
+    def iter_packages(self, source: str | BinaryIO) -> Iterator[ar_element.Package]:
+        """Parses the root packages of an ARXML file one at a time.
+
+        Each completed root ``AR-PACKAGE`` is handed to the per-package parser
+        and then cleared, so the XML working set stays around one package
+        instead of the whole document.
+
+        Args:
+            source: Path to an ARXML file, or a binary file object opened on one.
+
+        Returns:
+            Iterator over the parsed root packages, in document order.
+        """
+        context = etree.iterparse(
+            source,
+            events=("end",),
+            tag=_AR_PACKAGE_MATCH,
+            huge_tree=True,
+            remove_comments=True,
+            remove_pis=True,
+            collect_ids=False,
+        )
+        for _, xml_package in context:
+            xml_packages = xml_package.getparent()
+            # Nested packages are parsed together with their root package.
+            if xml_packages is None or xml_packages.getparent().getparent() is not None:
+                continue
+            _strip_namespace(xml_package)
+            yield self._read_package(xml_package)
+            xml_package.clear()
+            while xml_package.getprevious() is not None:
+                del xml_packages[0]
@@ -2,19 +2,41 @@
 
 This is used by the server layer to avoid sending raw Python objects across the
 tool boundary; tools exchange IDs instead.
+
+IDs are ``<prefix>_<index>`` where ``index`` is a slot in a list-backed slab,
+so lookups are a list index rather than a string-keyed hash lookup.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, field
+import sys
 from typing import Any
-import uuid
+
+# Zero-padded width of the numeric ID part. Keeps IDs at a stable length
+# (tool inputs require workspace IDs of at least five characters).
+_ID_WIDTH = 8
+_ID_FORMAT = f"0{_ID_WIDTH}d"
+
+# Prefix -> "<prefix>_", built once per distinct prefix.
+_ID_HEADS: dict[str, str] = {}
 
 
-@dataclass
 class ObjectRegistry:
     """Stores arbitrary objects keyed by generated IDs."""
 
-    _store: dict[str, Any] = field(default_factory=dict)
+    __slots__ = ("_slab",)
+
+    def __init__(self) -> None:
+        """Initializes an empty registry.
+
+        Args:
+            None.
+
+        Returns:
+            None.
+        """
+        # Each slot holds ``(oid, obj)``; deleted slots are set to None so that
+        # existing IDs never get reindexed.
+        self._slab: list[tuple[str, Any] | None] = []
 
     def put(self, obj: Any, prefix: str) -> str:
         """Stores an object and returns its generated ID.
@@ -26,8 +48,13 @@ class ObjectRegistry:
         Returns:
             Generated object ID.
         """
-        oid = f"{prefix}_{uuid.uuid4().hex}"
-        self._store[oid] = obj
+        head = _ID_HEADS.get(prefix)
+        if head is None:
+            head = _ID_HEADS[prefix] = prefix + "_"
+        idx = len(self._slab)
+        # Interned: IDs key every per-workspace cache in the manager.
+        oid = sys.intern(f"{head}{idx:{_ID_FORMAT}}")
+        self._slab.append((oid, obj))
         return oid
 
     def get(
@@ -46,13 +73,51 @@ class ObjectRegistry:
             KeyError: If the object ID does not exist.
             TypeError: If ``expected_type`` is provided and the object is not an instance of it.
         """
-        if oid not in self._store:
-            raise KeyError(f"Unknown id: {oid}")
-        obj = self._store[oid]
+        obj = self._slab[self._locate(oid)][1]
         if expected_type is not None and not isinstance(obj, expected_type):
             raise TypeError(f"{oid} is {type(obj)}, expected {expected_type}")
         return obj
 
+    def get_fast(self, oid: str) -> Any:
+        """Retrieves a stored object by ID without any type check.
+
+        Intended for callers that already know the object type from the ID
+        prefix they used in :meth:`put`.
+
+        Args:
+            oid: Object ID previously returned by :meth:`put`.
+
+        Returns:
+            The stored object.
+
+        Raises:
+            KeyError: If the object ID does not exist.
+        """
+        return self._slab[self._locate(oid)][1]
+
+    def replace(
+        self, oid: str, obj: Any, expected_type: type | tuple[type, ...] | None = None
+    ) -> None:
+        """Swaps the object stored under an existing ID.
+
+        Args:
+            oid: Object ID previously returned by :meth:`put`.
+            obj: New object to store under ``oid``.
+            expected_type: Optional type (or tuple of types) the current object must be.
+
+        Returns:
+            None.
+
+        Raises:
+            KeyError: If the object ID does not exist.
+            TypeError: If ``expected_type`` is provided and the current object is not an instance of it.
+        """
+        idx = self._locate(oid)
+        cur = self._slab[idx][1]
+        if expected_type is not None and not isinstance(cur, expected_type):
+            raise TypeError(f"{oid} is {type(cur)}, expected {expected_type}")
+        self._slab[idx] = (oid, obj)
+
     def delete(self, oid: str) -> None:
         """Deletes an object by ID.
 
@@ -62,4 +127,29 @@ class ObjectRegistry:
         Returns:
             None.
         """
-        self._store.pop(oid, None)
+        try:
+            self._slab[self._locate(oid)] = None
+        except KeyError:
+            pass
+
+    def _locate(self, oid: str) -> int:
+        """Resolves an object ID to its slab index.
+
+        Args:
+            oid: Object ID previously returned by :meth:`put`.
+
+        Returns:
+            Index of the occupied slot holding ``oid``.
+
+        Raises:
+            KeyError: If the object ID does not exist.
+        """
+        num = oid.rpartition("_")[2]
+        if num.isdecimal():
+            idx = int(num)
+            if idx < len(self._slab):
+                slot = self._slab[idx]
+                # Comparing the full ID also rejects a wrong prefix.
+                if slot is not None and slot[0] == oid:
+                    return idx
+        raise KeyError(f"Unknown id: {oid}")
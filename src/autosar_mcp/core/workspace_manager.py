@@ -4,18 +4,155 @@ This module provides an in-memory, ID-based API over ``autosar.xml.Workspace``.
 The server/tool layer exchanges string IDs instead of passing Python objects.
 """
 
+import functools
 import os
-from typing import Any, Optional
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Optional, TypeVar
 
 import autosar.xml
 import autosar.xml.reader as ar_reader
 import autosar.xml.writer as ar_writer
 import autosar.xml.element as ar_element
 
+from autosar_mcp.core.lxml_reader import LxmlReader
 from autosar_mcp.core.registry import ObjectRegistry
 
 # pylint: disable=line-too-long
 
+# Resolved once so hot paths do a single global lookup instead of
+# walking the ``autosar.xml`` attribute chain on every call.
+_Workspace = autosar.xml.Workspace
+_Document = autosar.xml.Document
+_Reader = ar_reader.Reader
+_Writer = ar_writer.Writer
+
+_WORKSPACE_PREFIX = "ws"
+_WORKSPACE_ID_PREFIX = _WORKSPACE_PREFIX + "_"
+
+# Component kind -> component type class. Unknown kinds fall back to
+# Application since other component types are not supported yet.
+_COMPONENT_CLASSES: dict[str, type] = {
+    "Application": ar_element.ApplicationSoftwareComponentType,
+    "Composition": ar_element.CompositionSwComponentType,
+}
+
+# Port kind -> SwComponentType port creator method.
+_PORT_CREATORS: dict[str, str] = {
+    "P": "create_p_port",
+    "R": "create_r_port",
+    "PR": "create_pr_port",
+}
+
+# Event kind -> (InternalBehavior method, ordered argument fields).
+_EVENT_CREATORS: dict[str, tuple[str, tuple[str, ...]]] = {
+    "timing": ("create_timing_event", ("runnable_name", "period")),
+    "data_received": ("create_data_received_event", ("runnable_name", "port_path", "data_element_name")),
+    "operation_invoked": ("create_operation_invoked_event", ("runnable_name", "operation_name")),
+    "mode_switch": ("create_mode_switch_event", ("runnable_name", "mode_group_ref")),
+}
+
+# Bulk operation type -> in-package creator method.
+_ELEMENT_CREATORS: dict[str, str] = {
+    "sw_base_type": "create_sw_base_type_in_package",
+    "unit": "create_unit_in_package",
+    "constant": "create_constant_in_package",
+}
+
+# Files up to this size are read in one chunk; larger files are parsed one
+# root package at a time.
+_STREAMING_THRESHOLD = 16 * 1024 * 1024
+
+# lxml parsing is opt-in (AUTOSAR_MCP_USE_LXML=1): it relies on the upstream
+# reader's private per-package hook, and its output has not been checked
+# against Reader.read_file() on the real library. By default loads use the
+# upstream ElementTree-based Reader.read_file().
+_USE_LXML = os.environ.get("AUTOSAR_MCP_USE_LXML", "0") == "1" and LxmlReader.is_supported()
+
+
+def _append_packages(ws: autosar.xml.Workspace, packages: Iterable[ar_element.Package]) -> None:
+    """Appends root packages to a workspace in one batch.
+
+    Appends through a pre-bound ``append`` so each package costs a single
+    call.
+
+    Args:
+        ws: Workspace to append to.
+        packages: Root packages to append, in order.
+
+    Returns:
+        None.
+    """
+    append = ws.append
+    for package in packages:
+        append(package)
+
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _mutating(method: _F) -> _F:
+    """Marks a ``WorkspaceManager`` method as changing workspace content.
+
+    The wrapped method's first argument after ``self`` must be the workspace
+    ID. Calling it forgets the workspace's last save, so the next
+    ``save_arxml`` serializes again.
+
+    Args:
+        method: Method to wrap.
+
+    Returns:
+        The wrapped method.
+    """
+    @functools.wraps(method)
+    def wrapper(self: "WorkspaceManager", workspace_id: str, *args: Any, **kwargs: Any) -> Any:
+        self._last_save.pop(workspace_id, None)  # pylint: disable=protected-access
+        return method(self, workspace_id, *args, **kwargs)
+    return wrapper  # type: ignore[return-value]
+
+
+def _file_signature(file_path: str) -> Optional[tuple[int, int]]:
+    """Returns a cheap change marker for a file.
+
+    Args:
+        file_path: Path of the file to stat.
+
+    Returns:
+        ``(mtime_ns, size)`` of the file, or None if it cannot be stat'ed.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _index_packages(index: dict[str, Any], packages: Iterable[ar_element.Package]) -> None:
+    """Records the path of every package and package element in a path index.
+
+    Walks the package tree with an explicit stack, building each path from
+    its parent's instead of calling ``ref()`` per element. Paths are interned
+    so package paths shared as prefixes and index keys are stored once.
+    Children of elements (ports, data elements, ...) are left to the lookup
+    fallback.
+
+    Args:
+        index: Path index to fill, mapping AUTOSAR paths to elements.
+        packages: Root packages to walk.
+
+    Returns:
+        None.
+    """
+    stack = [("", package) for package in packages]
+    while stack:
+        parent_path, package = stack.pop()
+        path = sys.intern(f"{parent_path}/{package.name}")
+        index[path] = package
+        for element in getattr(package, "elements", ()):
+            index[sys.intern(f"{path}/{element.name}")] = element
+        stack.extend((path, child) for child in getattr(package, "packages", ()))
+
 
 class WorkspaceManager:
     """
@@ -23,6 +160,8 @@ class WorkspaceManager:
     All objects are accessed via IDs.
     """
 
+    __slots__ = ("registry", "_path_index", "_root_names", "_summaries", "_writer_cache", "_reader", "_last_save")
+
     def __init__(self):
         """Initializes the workspace manager with an empty registry.
 
@@ -33,6 +172,14 @@ class WorkspaceManager:
             None.
         """
         self.registry = ObjectRegistry()
+        self._path_index: dict[str, dict[str, Any]] = {}
+        self._root_names: dict[str, list[str]] = {}
+        self._summaries: dict[str, dict[str, dict[str, Any]]] = {}
+        self._writer_cache: dict[int, ar_writer.Writer] = {}
+        self._reader: Optional[ar_reader.Reader] = None
+        # Workspace ID -> (absolute path, schema version, file signature) of
+        # the last save, kept only while the workspace is unchanged since.
+        self._last_save: dict[str, tuple[str, int, Optional[tuple[int, int]]]] = {}
 
     # --------------------------------------------------
     # Workspace lifecycle
@@ -45,10 +192,10 @@ class WorkspaceManager:
             None.
 
         Returns:
-            Workspace ID (e.g. ``ws_<uuid>``).
+            Workspace ID (e.g. ``ws_00000000``).
         """
-        ws = autosar.xml.Workspace()
-        return self.registry.put(ws, prefix="ws")
+        ws = _Workspace()
+        return self.registry.put(ws, prefix=_WORKSPACE_PREFIX)
 
     def delete_workspace(self, workspace_id: str) -> None:
         """Deletes a workspace from the registry.
@@ -60,6 +207,7 @@ class WorkspaceManager:
             None.
         """
         self.registry.delete(workspace_id)
+        self._invalidate_caches(workspace_id)
 
     def reset_workspace(self, workspace_id: str) -> None:
         """Resets an existing workspace ID to a new empty workspace.
@@ -74,9 +222,8 @@ class WorkspaceManager:
             KeyError: If the workspace ID does not exist.
             TypeError: If the ID exists but is not a workspace.
         """
-        self.registry.get(workspace_id, autosar.xml.Workspace)
-        new_ws = autosar.xml.Workspace()
-        self.registry._store[workspace_id] = new_ws  # overwrite safely
+        self.registry.replace(workspace_id, _Workspace(), _Workspace)
+        self._invalidate_caches(workspace_id)
 
     # --------------------------------------------------
     # ARXML I/O
@@ -85,6 +232,53 @@ class WorkspaceManager:
     def load_arxml(self, workspace_id: str, file_path: str) -> None:
         """Loads an ARXML file into a workspace.
 
+        A file that fails to parse leaves the workspace unchanged, including
+        files large enough to be streamed. If appending fails (for example on
+        a duplicate root package), the packages appended before it stay
+        loaded.
+
+        Args:
+            workspace_id: Workspace ID to load into.
+            file_path: Path to an ARXML file.
+
+        Returns:
+            None.
+
+        Raises:
+            FileNotFoundError: If ``file_path`` does not exist.
+            KeyError: If the workspace ID does not exist.
+            TypeError: If the ID exists but is not a workspace.
+        """
+        ws = self.get_workspace(workspace_id)
+
+        # Reindex even on failure: packages appended before the error stay
+        # in the workspace, so the caches must not describe the old content.
+        try:
+            if not _USE_LXML:
+                _append_packages(ws, self._shared_reader().read_file(file_path).packages)
+            else:
+                reader = self._shared_reader()
+                # A single open() both checks existence and serves the parse.
+                with open(file_path, "rb") as xml_file:
+                    if os.fstat(xml_file.fileno()).st_size > _STREAMING_THRESHOLD:
+                        # Only the XML is streamed; the built packages are
+                        # collected first so a parse error appends nothing.
+                        packages = list(reader.iter_packages(xml_file))
+                    else:
+                        packages = reader.read_packages(xml_file.read())
+                    _append_packages(ws, packages)
+        finally:
+            self._reindex(workspace_id, ws)
+
+    def load_arxml_streaming(self, workspace_id: str, file_path: str) -> None:
+        """Loads an ARXML file one root package at a time, whatever its size.
+
+        Keeps the XML working set around a single root package. Useful when
+        memory is tight even for files below the automatic streaming threshold.
+        Streaming needs the lxml reader (``AUTOSAR_MCP_USE_LXML=1``); without
+        it this is a plain :meth:`load_arxml`. As there, a file that fails to
+        parse leaves the workspace unchanged.
+
         Args:
             workspace_id: Workspace ID to load into.
             file_path: Path to an ARXML file.
@@ -97,21 +291,65 @@ class WorkspaceManager:
             KeyError: If the workspace ID does not exist.
             TypeError: If the ID exists but is not a workspace.
         """
-        ws = self.registry.get(workspace_id, autosar.xml.Workspace)
+        ws = self.get_workspace(workspace_id)
 
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(file_path)
+        # Reindex even if an append fails partway; see load_arxml.
+        try:
+            if not _USE_LXML:
+                _append_packages(ws, self._shared_reader().read_file(file_path).packages)
+            else:
+                with open(file_path, "rb") as xml_file:
+                    packages = list(self._shared_reader().iter_packages(xml_file))
+                _append_packages(ws, packages)
+        finally:
+            self._reindex(workspace_id, ws)
+
+    def load_arxml_many(self, workspace_id: str, file_paths: list[str]) -> None:
+        """Loads several ARXML files into a workspace, parsing them in parallel.
+
+        Files are tokenized concurrently on a thread pool. Packages are then
+        built and appended on the calling thread in ``file_paths`` order, as the
+        AUTOSAR object model is not thread-safe. Nothing is appended if any
+        file fails to tokenize; if appending fails, the files before the
+        failing one stay loaded.
 
-        reader = ar_reader.Reader()
-        document = reader.read_file(file_path)
+        Args:
+            workspace_id: Workspace ID to load into.
+            file_paths: Paths to ARXML files.
 
-        for package in document.packages:
-            ws.append(package)
+        Returns:
+            None.
+
+        Raises:
+            FileNotFoundError: If any path does not exist.
+            KeyError: If the workspace ID does not exist.
+            TypeError: If the ID exists but is not a workspace.
+        """
+        ws = self.get_workspace(workspace_id)
+
+        reader = self._shared_reader()
+        # Files appended before a failing one stay in the workspace.
+        try:
+            if not _USE_LXML:
+                for file_path in file_paths:
+                    _append_packages(ws, reader.read_file(file_path).packages)
+            else:
+                workers = max(1, min(len(file_paths), os.cpu_count() or 1))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    xml_roots = list(pool.map(LxmlReader.parse_file, file_paths))
+                for xml_root in xml_roots:
+                    _append_packages(ws, reader.read_tree(xml_root))
+        finally:
+            self._reindex(workspace_id, ws)
 
     # TODO: consider supporting older schema versions (e.g. 48-51) as a policy option.
     def save_arxml(self, workspace_id: str, file_path: str, version: int = 51) -> None:
         """Saves a workspace into an ARXML file.
 
+        If the workspace is unchanged since its last save with the same schema
+        version, and that file is untouched, the file is copied (or, for the
+        same path, left as is) instead of serializing the workspace again.
+
         Args:
             workspace_id: Workspace ID to save.
             file_path: Destination ARXML path to write.
@@ -124,15 +362,49 @@ class WorkspaceManager:
             KeyError: If the workspace ID does not exist.
             TypeError: If the ID exists but is not a workspace.
         """
-        ws = self.registry.get(workspace_id, autosar.xml.Workspace)
-
-        document = autosar.xml.Document(
+        ws = self.get_workspace(workspace_id)
+        file_path = os.path.abspath(file_path)
+
+        last = self._last_save.get(workspace_id)
+        if last is not None and last[1] == version and _file_signature(last[0]) == last[2]:
+            if last[0] != file_path:
+                try:
+                    shutil.copyfile(last[0], file_path)
+                except shutil.SameFileError:
+                    # Another name (symlink, hard link, case variant) for the
+                    # file already written: it is up to date.
+                    pass
+            return
+
+        document = _Document(
             packages=ws.packages,
             schema_version=version
         )
 
-        writer = ar_writer.Writer(schema_version=version)
+        writer = self._writer_cache.get(version)
+        if writer is None:
+            writer = self._writer_cache[version] = _Writer(schema_version=version)
         writer.write_file(document, file_path)
+        self._last_save[workspace_id] = (file_path, version, _file_signature(file_path))
+
+    def _shared_reader(self) -> ar_reader.Reader:
+        """Returns the reader shared by all loads, creating it on first use.
+
+        Reader construction builds the tag dispatch tables, and readers keep
+        no state between files, so one instance serves every load. Loads run
+        one at a time on the calling thread; the parallel loader only
+        tokenizes on its workers.
+
+        Args:
+            None.
+
+        Returns:
+            An ``LxmlReader`` when lxml parsing is enabled, else an upstream ``Reader``.
+        """
+        reader = self._reader
+        if reader is None:
+            reader = self._reader = LxmlReader() if _USE_LXML else _Reader()
+        return reader
 
     # --------------------------------------------------
     # Package Map
@@ -152,8 +424,9 @@ class WorkspaceManager:
             KeyError: If the workspace ID does not exist.
             TypeError: If the ID exists but is not a workspace.
         """
-        ws = self.registry.get(workspace_id, autosar.xml.Workspace)
+        ws = self.get_workspace(workspace_id)
         ws.create_package_map(mapping)
+        self._invalidate_caches(workspace_id)
 
     # --------------------------------------------------
     # Query helpers (LLM-safe)
@@ -162,6 +435,9 @@ class WorkspaceManager:
     def find_element(self, workspace_id: str, path: str) -> dict | None:
         """Finds an element by AUTOSAR path and returns a safe summary dict.
 
+        Summaries are cached per path: ``ref()`` rebuilds the reference by
+        walking up the parent chain, and names never change in place.
+
         Args:
             workspace_id: Workspace ID to query.
             path: AUTOSAR absolute path to search for.
@@ -169,18 +445,27 @@ class WorkspaceManager:
         Returns:
             A small dictionary describing the element (type/name/ref), or None if
             not found.
-        """
-        ws = self.registry.get(workspace_id, autosar.xml.Workspace)
-        element = ws.find(path)
-
-        if element is None:
-            return None
 
-        return {
-            "type": element.__class__.__name__,
-            "name": getattr(element, "name", None),
-            "ref": str(element.ref()) if hasattr(element, "ref") else None,
-        }
+        Raises:
+            KeyError: If the workspace ID does not exist.
+        """
+        summaries = self._summaries.get(workspace_id)
+        summary = summaries.get(path) if summaries is not None else None
+        if summary is None:
+            # _find validates the workspace ID before any cache entry is made.
+            element = self._find(workspace_id, path)
+            if element is None:
+                return None
+            ref = getattr(element, "ref", None)
+            summary = {
+                "type": type(element).__name__,
+                "name": getattr(element, "name", None),
+                "ref": str(ref()) if ref is not None else None,
+            }
+            if summaries is None:
+                summaries = self._summaries[workspace_id] = {}
+            summaries[sys.intern(path)] = summary
+        return dict(summary)
 
     def list_root_packages(self, workspace_id: str) -> list[str]:
         """Lists root package names for a workspace.
@@ -191,8 +476,29 @@ class WorkspaceManager:
         Returns:
             List of root package names.
         """
-        ws = self.registry.get(workspace_id, autosar.xml.Workspace)
-        return [pkg.name for pkg in ws.packages]
+        names = self._root_names.get(workspace_id)
+        if names is None:
+            ws = self.get_workspace(workspace_id)
+            names = self._root_names[workspace_id] = [pkg.name for pkg in ws.packages]
+        return list(names)
+
+    def list_arxml_root_packages(self, file_path: str) -> list[str]:
+        """Lists the root package names of an ARXML file without loading it.
+
+        The file is only tokenized, so this is much cheaper than loading it
+        into a workspace and calling :meth:`list_root_packages`.
+
+        Args:
+            file_path: Path to an ARXML file.
+
+        Returns:
+            Root package names, in document order.
+
+        Raises:
+            FileNotFoundError: If ``file_path`` does not exist.
+        """
+        with open(file_path, "rb") as xml_file:
+            return list(LxmlReader.iter_root_package_names(xml_file))
 
     def get_workspace(self, workspace_id: str) -> autosar.xml.Workspace:
         """Returns the underlying AUTOSAR workspace object for an ID.
@@ -207,7 +513,10 @@ class WorkspaceManager:
             KeyError: If the workspace ID does not exist.
             TypeError: If the ID exists but is not a workspace.
         """
-        return self.registry.get(workspace_id, autosar.xml.Workspace)
+        # Only workspaces are ever stored under the workspace prefix.
+        if workspace_id.startswith(_WORKSPACE_ID_PREFIX):
+            return self.registry.get_fast(workspace_id)
+        return self.registry.get(workspace_id, _Workspace)
 
     def get_element(self, workspace_id: str, path: str) -> Optional[Any]:
         """Returns a raw AUTOSAR element by path.
@@ -219,9 +528,132 @@ class WorkspaceManager:
         Returns:
             The found element object, or None if not found.
         """
+        return self._find(workspace_id, path)
+
+    def _find(self, workspace_id: str, path: str) -> Optional[Any]:
+        """Resolves a path through the per-workspace path index.
+
+        The index is filled when ARXML is loaded; other paths fall back to
+        ``ws.find`` and are added on a hit. Misses are not recorded, so
+        elements created later are still found. Elements are never removed in
+        place, so an indexed element stays valid until the workspace is
+        reloaded, reset or deleted.
+
+        Args:
+            workspace_id: Workspace ID to query.
+            path: AUTOSAR absolute path to search for.
+
+        Returns:
+            The found element object, or None if not found.
+
+        Raises:
+            KeyError: If the workspace ID does not exist.
+        """
         ws = self.get_workspace(workspace_id)
-        return ws.find(path)
+        index = self._path_index.get(workspace_id)
+        if index is None:
+            index = self._path_index[workspace_id] = {}
+        element = index.get(path)
+        if element is None:
+            element = ws.find(path)
+            if element is not None:
+                index[sys.intern(path)] = element
+        return element
+
+    def _find_typed(self, workspace_id: str, path: str, expected_type: type) -> Any:
+        """Resolves a path through the lookup cache and checks the element type.
+
+        Args:
+            workspace_id: Workspace ID to query.
+            path: AUTOSAR absolute path to search for.
+            expected_type: Class the element must be an instance of.
+
+        Returns:
+            The found element object.
+
+        Raises:
+            KeyError: If the workspace ID does not exist.
+            TypeError: If the element is missing or not an ``expected_type``.
+        """
+        element = self._find(workspace_id, path)
+        if not isinstance(element, expected_type):
+            raise TypeError(f"'{path}' is not a {expected_type.__name__}.")
+        return element
+
+    def _ensure_package(self, workspace_id: str, package_path: str) -> ar_element.Package:
+        """Returns the package at a path, creating missing packages on the way.
+
+        Existing packages come straight from the path index, so repeated
+        creation into one package skips ``make_packages``' per-level walk.
+
+        Args:
+            workspace_id: Workspace ID containing the package.
+            package_path: AUTOSAR path to the package, with or without leading '/'.
+
+        Returns:
+            The existing or newly created package.
+
+        Raises:
+            KeyError: If the workspace ID does not exist.
+        """
+        path = sys.intern("/" + package_path.lstrip("/"))
+        package = self._find(workspace_id, path)
+        if isinstance(package, ar_element.Package):
+            return package
+        package = self.get_workspace(workspace_id).make_packages(path[1:])
+        self._root_names.pop(workspace_id, None)
+        self._path_index[workspace_id][path] = package
+        return package
 
+    def _append_indexed(self, workspace_id: str, package_path: str, package: ar_element.Package, element: Any) -> None:
+        """Appends an element to a package and records it in the path index.
+
+        Saves the ``ws.find`` walk that the first lookup of a freshly created
+        element would otherwise take.
+
+        Args:
+            workspace_id: Workspace ID containing the package.
+            package_path: AUTOSAR path of ``package``.
+            package: Package to append to.
+            element: New element; must have a ``name``.
+
+        Returns:
+            None.
+        """
+        package.append(element)
+        index = self._path_index.get(workspace_id)
+        if index is not None:
+            index[sys.intern(f"/{package_path.strip('/')}/{element.name}")] = element
+
+    def _reindex(self, workspace_id: str, ws: autosar.xml.Workspace) -> None:
+        """Drops the caches of a workspace and rebuilds its path index.
+
+        Args:
+            workspace_id: Workspace ID to reindex.
+            ws: The workspace stored under ``workspace_id``.
+
+        Returns:
+            None.
+        """
+        self._invalidate_caches(workspace_id)
+        index = self._path_index[workspace_id] = {}
+        _index_packages(index, ws.packages)
+
+    def _invalidate_caches(self, workspace_id: str) -> None:
+        """Drops the path index, summaries, root package names and last save of a workspace.
+
+        Args:
+            workspace_id: Workspace ID whose caches to drop.
+
+        Returns:
+            None.
+        """
+        self._path_index.pop(workspace_id, None)
+        self._last_save.pop(workspace_id, None)
+        self._root_names.pop(workspace_id, None)
+        self._summaries.pop(workspace_id, None)
+
+    @_mutating
     def create_swc_internal_behavior(self, workspace_id: str, component_path: str) -> None:
         """Creates an internal behavior object for a software component.
 
@@ -232,10 +664,10 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        component = ws.find(component_path)
+        component = self._find(workspace_id, component_path)
         component.create_internal_behavior()
 
+    @_mutating
     def create_runnable(self, workspace_id: str, component_path: str, runnable_name: str, symbol: str) -> None:
         """Creates a runnable in a component's internal behavior.
 
@@ -248,12 +680,68 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        component = ws.find(component_path)
+        component = self._find(workspace_id, component_path)
         ib = component.internal_behavior
         ib.create_runnable(runnable_name, symbol=symbol)
 
 
+    @_mutating
+    def create_runnables_bulk(self, workspace_id: str, component_path: str, runnables: Iterable[Any]) -> None:
+        """Creates several runnables in a component's internal behavior.
+
+        The component and its internal behavior are resolved once for the
+        whole batch.
+
+        Args:
+            workspace_id: Workspace ID containing the component.
+            component_path: AUTOSAR path to the component type.
+            runnables: Items with ``name`` and ``symbol`` attributes.
+
+        Returns:
+            None.
+        """
+        ib = self._find(workspace_id, component_path).internal_behavior
+        create_runnable = ib.create_runnable
+        for item in runnables:
+            create_runnable(item.name, symbol=item.symbol)
+
+    @_mutating
+    def create_events_bulk(self, workspace_id: str, component_path: str, events: Iterable[Any]) -> None:
+        """Creates several RTE events in a component's internal behavior.
+
+        Each item selects its creator by ``kind`` (``timing``,
+        ``data_received``, ``operation_invoked`` or ``mode_switch``) and carries
+        the same fields as the matching single-event method. All items are
+        validated before any event is created.
+
+        Args:
+            workspace_id: Workspace ID containing the component.
+            component_path: AUTOSAR path to the component type.
+            events: Event items with ``kind`` and ``runnable_name`` attributes;
+                fields a kind does not use may be missing or None.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If an item has an unknown kind or lacks a required field.
+        """
+        calls = []
+        for event in events:
+            kind = getattr(event, "kind", None)
+            if kind not in _EVENT_CREATORS:
+                raise ValueError(f"Invalid event kind '{kind}'. Allowed: {', '.join(_EVENT_CREATORS)}")
+            method_name, fields = _EVENT_CREATORS[kind]
+            args = tuple(getattr(event, name, None) for name in fields)
+            if None in args:
+                raise ValueError(f"Event kind '{kind}' requires: {', '.join(fields)}")
+            calls.append((method_name, args))
+
+        ib = self._find(workspace_id, component_path).internal_behavior
+        for method_name, args in calls:
+            getattr(ib, method_name)(*args)
+
+    @_mutating
     def create_timing_event(self, workspace_id: str, component_path: str, runnable_name: str, period: float) -> None:
         """Creates a timing event that triggers a runnable.
 
@@ -266,12 +754,12 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        component = ws.find(component_path)
+        component = self._find(workspace_id, component_path)
         ib = component.internal_behavior
         ib.create_timing_event(runnable_name, period)
 
 
+    @_mutating
     def create_data_received_event(self, workspace_id: str, component_path: str, runnable_name: str, port_path: str, data_element_name: str) -> None:
         """Creates a data-received event that triggers a runnable.
 
@@ -285,12 +773,12 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        component = ws.find(component_path)
+        component = self._find(workspace_id, component_path)
         ib = component.internal_behavior
         ib.create_data_received_event(runnable_name, port_path, data_element_name)
 
 
+    @_mutating
     def create_operation_invoked_event(self, workspace_id: str, component_path: str, runnable_name: str, operation_name: str) -> None:
         """Creates an operation-invoked event that triggers a runnable.
 
@@ -303,12 +791,12 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        component = ws.find(component_path)
+        component = self._find(workspace_id, component_path)
         ib = component.internal_behavior
         ib.create_operation_invoked_event(runnable_name, operation_name)
 
 
+    @_mutating
     def create_mode_switch_event(self, workspace_id: str, component_path: str, runnable_name: str, mode_group_ref: str) -> None:
         """Creates a mode-switch event that triggers a runnable.
 
@@ -321,12 +809,12 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        component = ws.find(component_path)
+        component = self._find(workspace_id, component_path)
         ib = component.internal_behavior
         ib.create_mode_switch_event(runnable_name, mode_group_ref)
 
 
+    @_mutating
     def set_nonqueued_receiver_com_spec(self, workspace_id: str, component_path: str, port_name: str, data_element_name: str, alive_timeout: int | None) -> None:
         """Sets non-queued receiver communication spec on a port.
 
@@ -340,12 +828,12 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        component = ws.find(component_path)
+        component = self._find(workspace_id, component_path)
         port = component.find(port_name)
         port.set_nonqueued_receiver_com_spec(data_element_name, alive_timeout)
 
 
+    @_mutating
     def set_queued_sender_com_spec(self, workspace_id: str, component_path: str, port_name: str, data_element_name: str, queue_length: int) -> None:
         """Sets queued sender communication spec on a port.
 
@@ -359,12 +847,12 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        component = ws.find(component_path)
+        component = self._find(workspace_id, component_path)
         port = component.find(port_name)
         port.set_queued_sender_com_spec(data_element_name, queue_length)
 
 
+    @_mutating
     def create_mode_declaration_group(self, workspace_id: str, package_path: str, name: str, modes: list[str]) -> None:
         """Creates a ModeDeclarationGroup with given modes in a package.
 
@@ -377,14 +865,16 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        package = ws.find(package_path)
+        package = self._find(workspace_id, package_path)
         mdg = ar_element.ModeDeclarationGroup(name)
+        # Filled before it is attached, so the package sees one append.
+        create_mode_declaration = mdg.create_mode_declaration
         for mode in modes:
-            mdg.create_mode_declaration(mode)
-        package.append(mdg)
+            create_mode_declaration(mode)
+        self._append_indexed(workspace_id, package_path, package, mdg)
 
 
+    @_mutating
     def create_mode_switch_interface(self, workspace_id: str, package_path: str, name: str, mode_group_ref: str) -> None:
         """Creates a ModeSwitchInterface in a package.
 
@@ -397,12 +887,12 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        package = ws.find(package_path)
+        package = self._find(workspace_id, package_path)
         interface = ar_element.ModeSwitchInterface(name, mode_group_ref=mode_group_ref)
-        package.append(interface)
+        self._append_indexed(workspace_id, package_path, package, interface)
 
 
+    @_mutating
     def create_assembly_connector(self, workspace_id: str, composition_path: str, provider_component: str, provider_port: str, requester_component: str, requester_port: str) -> None:
         """Creates an assembly connector within a composition.
 
@@ -417,14 +907,14 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        composition = ws.find(composition_path)
+        composition = self._find(workspace_id, composition_path)
         composition.create_assembly_connector(
             provider_component, provider_port,
             requester_component, requester_port
         )
 
 
+    @_mutating
     def create_delegation_connector(self, workspace_id: str, composition_path: str, inner_component: str, inner_port: str, outer_port: str) -> None:
         """Creates a delegation connector within a composition.
 
@@ -438,13 +928,13 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        composition = ws.find(composition_path)
+        composition = self._find(workspace_id, composition_path)
         composition.create_delegation_connector(
             inner_component, inner_port, outer_port
         )
 
 
+    @_mutating
     def set_port_api_option(self, workspace_id: str, component_path: str, port_name: str, enable_take_address: bool, indirect_api: bool) -> None:
         """Sets PortAPIOption settings on a port.
 
@@ -458,11 +948,11 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        component = ws.find(component_path)
+        component = self._find(workspace_id, component_path)
         port = component.find(port_name)
         port.set_port_api_option(enable_take_address=enable_take_address, indirect_api=indirect_api)
 
+    @_mutating
     def create_sender_receiver_interface(self, workspace_id: str, package_path: str, name: str) -> None:
         """Creates a SenderReceiverInterface in a package.
 
@@ -474,14 +964,12 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        package = ws.find(package_path)
-        if not isinstance(package, ar_element.Package):
-            raise TypeError(f"'{package_path}' is not a Package.")
+        package = self._find_typed(workspace_id, package_path, ar_element.Package)
         interface = ar_element.SenderReceiverInterface(name)
-        package.append(interface)
+        self._append_indexed(workspace_id, package_path, package, interface)
 
 
+    @_mutating
     def create_data_element(self, workspace_id: str, interface_path: str, name: str, type_ref: str) -> None:
         """Creates a data element under a SenderReceiverInterface.
 
@@ -494,13 +982,30 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        interface = ws.find(interface_path)
-        if not isinstance(interface, ar_element.SenderReceiverInterface):
-            raise TypeError(f"'{interface_path}' is not a SenderReceiverInterface.")
+        interface = self._find_typed(workspace_id, interface_path, ar_element.SenderReceiverInterface)
         interface.create_data_element(name, type_ref)
 
 
+    @_mutating
+    def create_data_elements_bulk(self, workspace_id: str, interface_path: str, data_elements: Iterable[Any]) -> None:
+        """Creates several data elements under one SenderReceiverInterface.
+
+        The interface is resolved and type-checked once for the whole batch.
+
+        Args:
+            workspace_id: Workspace ID containing the interface.
+            interface_path: AUTOSAR path to the sender-receiver interface.
+            data_elements: Items with ``name`` and ``type_ref`` attributes.
+
+        Returns:
+            None.
+        """
+        interface = self._find_typed(workspace_id, interface_path, ar_element.SenderReceiverInterface)
+        create_data_element = interface.create_data_element
+        for item in data_elements:
+            create_data_element(item.name, item.type_ref)
+
+    @_mutating
     def create_client_server_interface(self, workspace_id: str, package_path: str, name: str) -> None:
         """Creates a ClientServerInterface in a package.
 
@@ -512,14 +1017,12 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        package = ws.find(package_path)
-        if not isinstance(package, ar_element.Package):
-            raise TypeError(f"'{package_path}' is not a Package.")
+        package = self._find_typed(workspace_id, package_path, ar_element.Package)
         interface = ar_element.ClientServerInterface(name)
-        package.append(interface)
+        self._append_indexed(workspace_id, package_path, package, interface)
 
 
+    @_mutating
     def create_operation(self, workspace_id: str, interface_path: str, name: str) -> None:
         """Creates an operation under a ClientServerInterface.
 
@@ -531,13 +1034,31 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        interface = ws.find(interface_path)
-        if not isinstance(interface, ar_element.ClientServerInterface):
-            raise TypeError(f"'{interface_path}' is not a ClientServerInterface.")
+        interface = self._find_typed(workspace_id, interface_path, ar_element.ClientServerInterface)
         interface.create_operation(name)
 
 
+    @_mutating
+    def create_operations_bulk(self, workspace_id: str, interface_path: str, names: list[str]) -> None:
+        """Creates several operations under one ClientServerInterface.
+
+        The interface is resolved and type-checked once for the whole batch.
+
+        Args:
+            workspace_id: Workspace ID containing the interface.
+            interface_path: AUTOSAR path to the client-server interface.
+            names: Operation short names.
+
+        Returns:
+            None.
+        """
+        interface = self._find_typed(workspace_id, interface_path, ar_element.ClientServerInterface)
+        create_operation = interface.create_operation
+        for name in names:
+            create_operation(name)
+
+
+    @_mutating
     def create_component_type(self, workspace_id: str, package_path: str, name: str, component_type: str) -> None:
         """Creates a software component type in a package.
 
@@ -550,22 +1071,12 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        package = ws.find(package_path)
-        if not isinstance(package, ar_element.Package):
-            raise TypeError(f"'{package_path}' is not a Package.")
-
-        if component_type == "Application":
-            component = ar_element.ApplicationSoftwareComponentType(name)
-        elif component_type == "Composition":
-            component = ar_element.CompositionSwComponentType(name)
-        else:
-            # Fallback to Application since other types don't exist
-            component = ar_element.ApplicationSoftwareComponentType(name)
-
-        package.append(component)
+        package = self._find_typed(workspace_id, package_path, ar_element.Package)
+        component_class = _COMPONENT_CLASSES.get(component_type, ar_element.ApplicationSoftwareComponentType)
+        self._append_indexed(workspace_id, package_path, package, component_class(name))
 
 
+    @_mutating
     def create_port(self, workspace_id: str, component_path: str, port_name: str, interface_path: str, port_type: str) -> None:
         """Creates a port on a software component type.
 
@@ -578,26 +1089,57 @@ class WorkspaceManager:
 
         Returns:
             None.
+
+        Raises:
+            ValueError: If ``port_type`` is invalid or the interface is not found.
         """
-        ws = self.get_workspace(workspace_id)
-        component = ws.find(component_path)
-        if not isinstance(component, ar_element.SwComponentType):
-            raise TypeError(f"'{component_path}' is not a SwComponentType.")
+        creator_name = _PORT_CREATORS.get(port_type)
+        if creator_name is None:
+            raise ValueError(f"Invalid port_type '{port_type}'.")
 
-        interface = ws.find(interface_path)
+        component = self._find_typed(workspace_id, component_path, ar_element.SwComponentType)
+
+        interface = self._find(workspace_id, interface_path)
         if interface is None:
             raise ValueError(f"Interface '{interface_path}' not found.")
 
-        if port_type == "P":
-            component.create_p_port(port_name, interface)
-        elif port_type == "R":
-            component.create_r_port(port_name, interface)
-        elif port_type == "PR":
-            component.create_pr_port(port_name, interface)
-        else:
-            raise ValueError(f"Invalid port_type '{port_type}'.")
+        getattr(component, creator_name)(port_name, interface)
 
 
+    @_mutating
+    def create_ports_bulk(self, workspace_id: str, component_path: str, ports: Iterable[Any]) -> None:
+        """Creates several ports on one software component type.
+
+        The component is resolved once; interfaces resolve through the path
+        index. All port types and interfaces are checked before any port is
+        created.
+
+        Args:
+            workspace_id: Workspace ID containing the component.
+            component_path: AUTOSAR path to the component type.
+            ports: Items with ``port_name``, ``interface_path`` and ``port_type`` attributes.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If a port type is invalid or an interface is not found.
+        """
+        calls = []
+        for item in ports:
+            creator_name = _PORT_CREATORS.get(item.port_type)
+            if creator_name is None:
+                raise ValueError(f"Invalid port_type '{item.port_type}'.")
+            interface = self._find(workspace_id, item.interface_path)
+            if interface is None:
+                raise ValueError(f"Interface '{item.interface_path}' not found.")
+            calls.append((creator_name, item.port_name, interface))
+
+        component = self._find_typed(workspace_id, component_path, ar_element.SwComponentType)
+        for creator_name, port_name, interface in calls:
+            getattr(component, creator_name)(port_name, interface)
+
+    @_mutating
     def create_implementation_data_type(
         self,
         workspace_id: str,
@@ -615,15 +1157,13 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        package = ws.find(package_path)
-        if not isinstance(package, ar_element.Package):
-            raise TypeError(f"'{package_path}' is not a Package.")
+        package = self._find_typed(workspace_id, package_path, ar_element.Package)
 
         data_type = ar_element.ImplementationDataType(name, category=category)
-        package.append(data_type)
+        self._append_indexed(workspace_id, package_path, package, data_type)
 
 
+    @_mutating
     def create_sw_base_type_in_package(
         self,
         workspace_id: str,
@@ -652,8 +1192,7 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        pkg = ws.make_packages(package_path.lstrip("/"))
+        pkg = self._ensure_package(workspace_id, package_path)
         elem = ar_element.SwBaseType(
             name=name,
             size=size,
@@ -663,9 +1202,10 @@ class WorkspaceManager:
             byte_order=byte_order,
             native_declaration=native_declaration,
         )
-        pkg.append(elem)
+        self._append_indexed(workspace_id, package_path, pkg, elem)
 
 
+    @_mutating
     def create_unit_in_package(
         self,
         workspace_id: str,
@@ -690,8 +1230,7 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        pkg = ws.make_packages(package_path.lstrip("/"))
+        pkg = self._ensure_package(workspace_id, package_path)
         unit = ar_element.Unit(
             name=name,
             display_name=display_name,
@@ -699,9 +1238,10 @@ class WorkspaceManager:
             offset=offset,
             physical_dimension_ref=physical_dimension_ref,
         )
-        pkg.append(unit)
+        self._append_indexed(workspace_id, package_path, pkg, unit)
 
 
+    @_mutating
     def create_constant_in_package(self, workspace_id: str, package_path: str, name: str, value) -> None:
         """Creates a ConstantSpecification in a package (creating packages if needed).
 
@@ -714,12 +1254,58 @@ class WorkspaceManager:
         Returns:
             None.
         """
-        ws = self.get_workspace(workspace_id)
-        pkg = ws.make_packages(package_path.lstrip("/"))
+        pkg = self._ensure_package(workspace_id, package_path)
         const = ar_element.ConstantSpecification.make_constant(name=name, value=value)
-        pkg.append(const)
+        self._append_indexed(workspace_id, package_path, pkg, const)
+
+
+    @_mutating
+    def create_elements_bulk(self, workspace_id: str, operations: Iterable[Any]) -> None:
+        """Creates several SwBaseTypes, Units and Constants in one call.
+
+        Each operation selects its creator by ``op_type`` (``sw_base_type``,
+        ``unit`` or ``constant``). Its other keys are passed to the matching
+        ``create_*_in_package`` method as keyword arguments. Packages resolved
+        once stay in the path index, so repeated ``package_path`` values are
+        single dict hits.
 
+        Only the operation types are checked before anything is created. The
+        operations are not applied atomically: if one fails (for example on a
+        duplicate name), the operations before it stay applied, and the
+        error names how many succeeded.
 
+        Args:
+            workspace_id: Workspace ID to create the elements in.
+            operations: Operations with ``op_type`` and ``package_path`` fields,
+                as dicts or models that ``dict()`` accepts.
+
+        Returns:
+            None.
+
+        Raises:
+            ValueError: If an operation has an unknown ``op_type``, or if an
+                operation fails; in that case operations ``0`` to ``index - 1``
+                were applied and the original error is chained as the cause.
+        """
+        calls = []
+        for operation in operations:
+            kwargs = dict(operation)
+            op_type = kwargs.pop("op_type", None)
+            method_name = _ELEMENT_CREATORS.get(op_type)
+            if method_name is None:
+                raise ValueError(f"Invalid op_type '{op_type}'. Allowed: {', '.join(_ELEMENT_CREATORS)}")
+            calls.append((op_type, getattr(self, method_name), kwargs))
+
+        for index, (op_type, create, kwargs) in enumerate(calls):
+            try:
+                create(workspace_id, **kwargs)
+            except (KeyError, TypeError, ValueError) as exc:
+                raise ValueError(
+                    f"Operation {index} ({op_type} '{kwargs.get('name')}') failed; "
+                    f"{index} of {len(calls)} operations were applied: {exc}"
+                ) from exc
+
+    @_mutating
     def add_sw_base_type_by_package_key(self, workspace_id: str, package_key: str, **kwargs) -> None:
         """Adds a SwBaseType element to a package selected by package map key.
 
@@ -736,6 +1322,7 @@ class WorkspaceManager:
         ws.add_element(package_key, elem)
 
 
+    @_mutating
     def add_constant_by_package_key(self, workspace_id: str, package_key: str, name: str, value) -> None:
         """Adds a ConstantSpecification to a package selected by package map key.
 
@@ -753,6 +1340,7 @@ class WorkspaceManager:
         ws.add_element(package_key, const)
 
 
+    @_mutating
     def add_unit_by_package_key(self, workspace_id: str, package_key: str, **kwargs) -> None:
         """Adds a Unit element to a package selected by package map key.
 
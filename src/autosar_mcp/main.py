@@ -1,8 +1,25 @@
 from __future__ import annotations
+import asyncio
+import sys
+
 from autosar_mcp.server import create_app
 
+try:
+    import uvloop
+except ImportError:  # optional: pip install autosar_arxml_mcp[fast]
+    uvloop = None
+
 def main() -> None:
    
+    if uvloop is not None and sys.version_info >= (3, 14):
+        # Loop policies are deprecated from 3.14: run the stdio server (what
+        # app.run() starts by default) on a uvloop loop directly.
+        uvloop.run(create_app().run_stdio_async())
+        return
+
+    # FastMCP starts its loop through anyio, which honours the loop policy.
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     app = create_app()
     app.run()
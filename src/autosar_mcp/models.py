@@ -3,11 +3,22 @@
 This module defines request/response schemas used by the server/tool layer.
 All models forbid extra fields to keep inputs strict and predictable.
 """
-from typing import Any, Optional, Literal
+from typing import Annotated, Any, Optional, Literal, Union
 from pydantic import BaseModel, Field, ConfigDict
 
 # pylint: disable=line-too-long
 
+# -------------------------
+# Constrained tool arguments
+# -------------------------
+# Used directly in tool signatures: FastMCP validates call arguments against
+# the signature, so these tools need no separate request model round-trip.
+
+WorkspaceId = Annotated[str, Field(min_length=5)]
+NonEmptyStr = Annotated[str, Field(min_length=1)]
+SchemaVersion = Annotated[int, Field(ge=1)]
+FilePaths = Annotated[list[str], Field(min_length=1)]
+
 # -------------------------
 # Pydantic I/O models
 # -------------------------
@@ -118,6 +129,88 @@ class CreatePortIn(BaseModel):
     port_type: str = Field(..., min_length=1)  # P, R, PR
 
 
+class RunnableSpec(BaseModel):
+    """A runnable to create as part of a bulk request."""
+    model_config = ConfigDict(extra="forbid")
+    name: str = Field(..., min_length=1)
+    symbol: str = Field(..., min_length=1)
+
+
+class PortSpec(BaseModel):
+    """A port to create as part of a bulk request."""
+    model_config = ConfigDict(extra="forbid")
+    port_name: str = Field(..., min_length=1)
+    interface_path: str = Field(..., min_length=1)
+    port_type: Literal["P", "R", "PR"]
+
+
+class DataElementSpec(BaseModel):
+    """A data element to create as part of a bulk request."""
+    model_config = ConfigDict(extra="forbid")
+    name: str = Field(..., min_length=1)
+    type_ref: str = Field(..., min_length=1)
+
+
+class EventSpec(BaseModel):
+    """An RTE event to create as part of a bulk request; used fields depend on ``kind``."""
+    model_config = ConfigDict(extra="forbid")
+    kind: Literal["timing", "data_received", "operation_invoked", "mode_switch"]
+    runnable_name: str = Field(..., min_length=1)
+    period: Optional[float] = None
+    port_path: Optional[str] = None
+    data_element_name: Optional[str] = None
+    operation_name: Optional[str] = None
+    mode_group_ref: Optional[str] = None
+
+
+class SwBaseTypeOp(BaseModel):
+    """Bulk operation creating a SwBaseType in a package."""
+    model_config = ConfigDict(extra="forbid")
+    op_type: Literal["sw_base_type"]
+    package_path: str = Field(..., min_length=1)
+    name: str = Field(..., min_length=1)
+    size: Optional[int] = None
+    max_size: Optional[int] = None
+    encoding: Optional[str] = None
+    alignment: Optional[int] = None
+    byte_order: Optional[str] = None
+    native_declaration: Optional[str] = None
+
+
+class UnitOp(BaseModel):
+    """Bulk operation creating a Unit in a package."""
+    model_config = ConfigDict(extra="forbid")
+    op_type: Literal["unit"]
+    package_path: str = Field(..., min_length=1)
+    name: str = Field(..., min_length=1)
+    display_name: Optional[str] = None
+    factor: Optional[float] = None
+    offset: Optional[float] = None
+    physical_dimension_ref: Optional[str] = None
+
+
+class ConstantOp(BaseModel):
+    """Bulk operation creating a ConstantSpecification in a package."""
+    model_config = ConfigDict(extra="forbid")
+    op_type: Literal["constant"]
+    package_path: str = Field(..., min_length=1)
+    name: str = Field(..., min_length=1)
+    value: Any
+
+
+# -------------------------
+# Bulk tool arguments
+# -------------------------
+# Typed item lists, so the published tool schema lists every item field.
+
+RunnableSpecs = Annotated[list[RunnableSpec], Field(min_length=1)]
+PortSpecs = Annotated[list[PortSpec], Field(min_length=1)]
+DataElementSpecs = Annotated[list[DataElementSpec], Field(min_length=1)]
+EventSpecs = Annotated[list[EventSpec], Field(min_length=1)]
+ShortNames = Annotated[list[NonEmptyStr], Field(min_length=1)]
+ElementOps = Annotated[list[Annotated[Union[SwBaseTypeOp, UnitOp, ConstantOp], Field(discriminator="op_type")]], Field(min_length=1)]
+
+
 class CreateImplementationDataTypeIn(BaseModel):
     """Request model for creating an ImplementationDataType."""
     model_config = ConfigDict(extra="forbid")
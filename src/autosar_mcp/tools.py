@@ -4,202 +4,270 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+import asyncio
+import functools
 import logging
 
-import autosar.xml.element as ar_element
-import autosar.xml.enumeration as ar_enum
-import autosar.xml as ar_xml
-
 from autosar_mcp import models
+from autosar_mcp.core.registry import ObjectRegistry
 from autosar_mcp.core.workspace_manager import WorkspaceManager
 
 logger = logging.getLogger("autosar_mcp.tools.tools")
 
+# Finished background jobs kept for poll_job; older unpolled results are dropped.
+_MAX_FINISHED_JOBS = 64
+
+
 def register_tools(mcp: Any, manager: WorkspaceManager) -> None:
     """
     Register MCP tools on a FastMCP instance.
     """
 
-    def _get_workspace(workspace_id: str) -> ar_xml.Workspace:
-        return manager.get_workspace(workspace_id)
-
-    def _get_element(workspace: ar_xml.Workspace, path: str):
-        return workspace.find(path)
-
-    def _ensure_package(workspace: ar_xml.Workspace, package_path: str) -> ar_element.Package:
-        # Workspace.make_packages expects a ref WITHOUT leading '/'
-        ref = package_path[1:] if package_path.startswith("/") else package_path
-        if not ref:
-            raise ValueError("package_path cannot be '/'")
-        return workspace.make_packages(ref)
-
-    def _parse_byte_order(value: Optional[str]) -> Optional[ar_enum.ByteOrder]:
-        if value is None:
-            return None
-        # Map strings to enums if possible; keep strict & explicit.
-        mapping = {
-            "BIG_ENDIAN": ar_enum.ByteOrder.BIG_ENDIAN,
-            "LITTLE_ENDIAN": ar_enum.ByteOrder.LITTLE_ENDIAN,
-            "OPAQUE": ar_enum.ByteOrder.OPAQUE,
-        }
-        if value not in mapping:
-            raise ValueError(f"Invalid byte_order '{value}'. Allowed: {', '.join(mapping.keys())}")
-        return mapping[value]
+    # Every manager call runs on this worker so blocking loads and saves never
+    # stall the event loop. One worker: the AUTOSAR object model, the shared
+    # reader and the cached writers are not thread-safe, so confining them to
+    # a single thread keeps tool calls from racing each other.
+    model_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autosar-mcp")
+
+    async def _call_manager(fn, *args, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(model_thread, functools.partial(fn, *args, **kwargs))
+
+    # Background load/save jobs started by the start_* tools, keyed by job ID.
+    jobs = ObjectRegistry()
+    # IDs of finished jobs, oldest first; bounds how many results are retained.
+    finished_jobs: deque[str] = deque()
+
+    def _on_job_done(job_id: str) -> None:
+        finished_jobs.append(job_id)
+        while len(finished_jobs) > _MAX_FINISHED_JOBS:
+            old_id = finished_jobs.popleft()
+            try:
+                old = jobs.get(old_id)
+            except KeyError:
+                continue  # already removed by poll_job
+            # Retrieve a failure so asyncio does not log it as never retrieved.
+            if not old.cancelled():
+                old.exception()
+            jobs.delete(old_id)
+
+    def _submit_job(fn, *args) -> dict[str, Any]:
+        future = asyncio.get_running_loop().run_in_executor(model_thread, functools.partial(fn, *args))
+        job_id = jobs.put(future, prefix="job")
+        future.add_done_callback(lambda _: _on_job_done(job_id))
+        return {"job_id": job_id, "status": "running"}
 
     @mcp.tool()
     async def create_workspace() -> dict[str, Any]:
-        ws_id = manager.create_workspace()
-        return models.CreateWorkspaceOut(workspace_id=ws_id).model_dump()
+        ws_id = await _call_manager(manager.create_workspace)
+        return {"workspace_id": ws_id}
+
+    @mcp.tool()
+    async def reset_workspace(workspace_id: models.WorkspaceId) -> dict[str, Any]:
+        await _call_manager(manager.reset_workspace, workspace_id)
+        return {"ok": True}
 
     @mcp.tool()
-    async def reset_workspace(workspace_id: str) -> dict[str, Any]:
-        req = models.WorkspaceIdIn(workspace_id=workspace_id)
-        manager.reset_workspace(req.workspace_id)
+    async def delete_workspace(workspace_id: models.WorkspaceId) -> dict[str, Any]:
+        await _call_manager(manager.delete_workspace, workspace_id)
         return {"ok": True}
 
     @mcp.tool()
-    async def delete_workspace(workspace_id: str) -> dict[str, Any]:
-        req = models.WorkspaceIdIn(workspace_id=workspace_id)
-        manager.delete_workspace(req.workspace_id)
+    async def load_arxml(workspace_id: models.WorkspaceId, file_path: models.NonEmptyStr) -> dict[str, Any]:
+        await _call_manager(manager.load_arxml, workspace_id, file_path)
         return {"ok": True}
 
     @mcp.tool()
-    async def load_arxml(workspace_id: str, file_path: str) -> dict[str, Any]:
-        req = models.LoadArxmlIn(workspace_id=workspace_id, file_path=file_path)
-        manager.load_arxml(req.workspace_id, req.file_path)
+    async def load_arxml_streaming(workspace_id: models.WorkspaceId, file_path: models.NonEmptyStr) -> dict[str, Any]:
+        await _call_manager(manager.load_arxml_streaming, workspace_id, file_path)
         return {"ok": True}
 
     @mcp.tool()
-    async def save_arxml(workspace_id: str, file_path: str, version: int = 51) -> dict[str, Any]:
-        req = models.SaveArxmlIn(workspace_id=workspace_id, file_path=file_path, version=version)
-        manager.save_arxml(req.workspace_id, req.file_path, req.version)
+    async def load_arxml_many(workspace_id: models.WorkspaceId, file_paths: models.FilePaths) -> dict[str, Any]:
+        await _call_manager(manager.load_arxml_many, workspace_id, file_paths)
         return {"ok": True}
 
     @mcp.tool()
-    async def create_package_map(workspace_id: str, mapping: dict[str, str]) -> dict[str, Any]:
-        req = models.CreatePackageMapIn(workspace_id=workspace_id, mapping=mapping)
-        manager.create_package_map(req.workspace_id, req.mapping)
+    async def save_arxml(workspace_id: models.WorkspaceId, file_path: models.NonEmptyStr, version: models.SchemaVersion = 51) -> dict[str, Any]:
+        await _call_manager(manager.save_arxml, workspace_id, file_path, version)
         return {"ok": True}
 
     @mcp.tool()
-    async def find_element(workspace_id: str, path: str) -> dict[str, Any]:
-        req = models.FindElementIn(workspace_id=workspace_id, path=path)
-        elem = manager.find_element(req.workspace_id, req.path)
-        out = models.FindElementOut(found=elem is not None, element=elem)
-        return out.model_dump()
+    async def start_load_arxml(workspace_id: models.WorkspaceId, file_path: models.NonEmptyStr) -> dict[str, Any]:
+        return _submit_job(manager.load_arxml, workspace_id, file_path)
 
     @mcp.tool()
-    async def list_root_packages(workspace_id: str) -> dict[str, Any]:
-        req = models.WorkspaceIdIn(workspace_id=workspace_id)
-        pkgs = manager.list_root_packages(req.workspace_id)
-        return models.ListRootPackagesOut(packages=pkgs).model_dump()
+    async def start_save_arxml(workspace_id: models.WorkspaceId, file_path: models.NonEmptyStr, version: models.SchemaVersion = 51) -> dict[str, Any]:
+        return _submit_job(manager.save_arxml, workspace_id, file_path, version)
+
+    @mcp.tool()
+    async def poll_job(job_id: models.NonEmptyStr) -> dict[str, Any]:
+        """Reports the status of a background job started by a start_* tool.
+
+        A finished job is forgotten once polled. Only the most recent
+        finished jobs are retained; an older result that was never polled is
+        dropped, and polling its ID then fails as an unknown job.
+        """
+        future = jobs.get(job_id)
+        if not future.done():
+            return {"job_id": job_id, "status": "running"}
+        jobs.delete(job_id)
+        exc = future.exception()
+        if exc is not None:
+            return {"job_id": job_id, "status": "failed", "error": f"{type(exc).__name__}: {exc}"}
+        return {"job_id": job_id, "status": "done"}
+
+    @mcp.tool()
+    async def create_package_map(workspace_id: models.WorkspaceId, mapping: dict[str, str]) -> dict[str, Any]:
+        await _call_manager(manager.create_package_map, workspace_id, mapping)
+        return {"ok": True}
+
+    @mcp.tool()
+    async def find_element(workspace_id: models.WorkspaceId, path: models.NonEmptyStr) -> dict[str, Any]:
+        elem = await _call_manager(manager.find_element, workspace_id, path)
+        return {"found": elem is not None, "element": elem}
+
+    @mcp.tool()
+    async def list_root_packages(workspace_id: models.WorkspaceId) -> dict[str, Any]:
+        pkgs = await _call_manager(manager.list_root_packages, workspace_id)
+        return {"packages": pkgs}
+
+    @mcp.tool()
+    async def list_arxml_root_packages(file_path: models.NonEmptyStr) -> dict[str, Any]:
+        pkgs = await _call_manager(manager.list_arxml_root_packages, file_path)
+        return {"packages": pkgs}
 
     @mcp.tool()
     async def create_swc_internal_behavior(workspace_id: str, component_path: str) -> dict:
-        manager.create_swc_internal_behavior(workspace_id, component_path)
+        await _call_manager(manager.create_swc_internal_behavior, workspace_id, component_path)
         return {"ok": True}
 
 
     @mcp.tool()
     async def create_runnable(workspace_id: str, component_path: str, runnable_name: str, symbol: str) -> dict:
-        manager.create_runnable(workspace_id, component_path, runnable_name, symbol)
+        await _call_manager(manager.create_runnable, workspace_id, component_path, runnable_name, symbol)
+        return {"ok": True}
+
+
+    @mcp.tool()
+    async def create_runnables_bulk(workspace_id: models.WorkspaceId, component_path: models.NonEmptyStr, runnables: models.RunnableSpecs) -> dict:
+        await _call_manager(manager.create_runnables_bulk, workspace_id, component_path, runnables)
+        return {"ok": True}
+
+
+    @mcp.tool()
+    async def create_events_bulk(workspace_id: models.WorkspaceId, component_path: models.NonEmptyStr, events: models.EventSpecs) -> dict:
+        await _call_manager(manager.create_events_bulk, workspace_id, component_path, events)
         return {"ok": True}
 
 
     @mcp.tool()
     async def create_timing_event(workspace_id: str, component_path: str, runnable_name: str, period: float) -> dict:
-        manager.create_timing_event(workspace_id, component_path, runnable_name, period)
+        await _call_manager(manager.create_timing_event, workspace_id, component_path, runnable_name, period)
         return {"ok": True}
 
 
     @mcp.tool()
     async def create_data_received_event(workspace_id: str, component_path: str, runnable_name: str, port_path: str, data_element_name: str) -> dict:
-        manager.create_data_received_event(workspace_id, component_path, runnable_name, port_path, data_element_name)
+        await _call_manager(manager.create_data_received_event, workspace_id, component_path, runnable_name, port_path, data_element_name)
         return {"ok": True}
 
 
     @mcp.tool()
     async def create_operation_invoked_event(workspace_id: str, component_path: str, runnable_name: str, operation_name: str) -> dict:
-        manager.create_operation_invoked_event(workspace_id, component_path, runnable_name, operation_name)
+        await _call_manager(manager.create_operation_invoked_event, workspace_id, component_path, runnable_name, operation_name)
         return {"ok": True}
 
 
     @mcp.tool()
     async def create_mode_switch_event(workspace_id: str, component_path: str, runnable_name: str, mode_group_ref: str) -> dict:
-        manager.create_mode_switch_event(workspace_id, component_path, runnable_name, mode_group_ref)
+        await _call_manager(manager.create_mode_switch_event, workspace_id, component_path, runnable_name, mode_group_ref)
         return {"ok": True}
 
 
     @mcp.tool()
     async def set_nonqueued_receiver_com_spec(workspace_id: str, component_path: str, port_name: str, data_element_name: str, alive_timeout: int | None = None) -> dict:
-        manager.set_nonqueued_receiver_com_spec(workspace_id, component_path, port_name, data_element_name, alive_timeout)
+        await _call_manager(manager.set_nonqueued_receiver_com_spec, workspace_id, component_path, port_name, data_element_name, alive_timeout)
         return {"ok": True}
 
 
     @mcp.tool()
     async def set_queued_sender_com_spec(workspace_id: str, component_path: str, port_name: str, data_element_name: str, queue_length: int) -> dict:
-        manager.set_queued_sender_com_spec(workspace_id, component_path, port_name, data_element_name, queue_length)
+        await _call_manager(manager.set_queued_sender_com_spec, workspace_id, component_path, port_name, data_element_name, queue_length)
         return {"ok": True}
 
 
     @mcp.tool()
     async def create_mode_declaration_group(workspace_id: str, package_path: str, name: str, modes: list[str]) -> dict:
-        manager.create_mode_declaration_group(workspace_id, package_path, name, modes)
+        await _call_manager(manager.create_mode_declaration_group, workspace_id, package_path, name, modes)
         return {"ok": True}
 
 
     @mcp.tool()
     async def create_mode_switch_interface(workspace_id: str, package_path: str, name: str, mode_group_ref: str) -> dict:
-        manager.create_mode_switch_interface(workspace_id, package_path, name, mode_group_ref)
+        await _call_manager(manager.create_mode_switch_interface, workspace_id, package_path, name, mode_group_ref)
         return {"ok": True}
 
 
     @mcp.tool()
     async def create_assembly_connector(workspace_id: str, composition_path: str, provider_component: str, provider_port: str, requester_component: str, requester_port: str) -> dict:
-        manager.create_assembly_connector(workspace_id, composition_path, provider_component, provider_port, requester_component, requester_port)
+        await _call_manager(manager.create_assembly_connector, workspace_id, composition_path, provider_component, provider_port, requester_component, requester_port)
         return {"ok": True}
 
 
     @mcp.tool()
     async def create_delegation_connector(workspace_id: str, composition_path: str, inner_component: str, inner_port: str, outer_port: str) -> dict:
-        manager.create_delegation_connector(workspace_id, composition_path, inner_component, inner_port, outer_port)
+        await _call_manager(manager.create_delegation_connector, workspace_id, composition_path, inner_component, inner_port, outer_port)
         return {"ok": True}
 
 
     @mcp.tool()
     async def set_port_api_option(workspace_id: str, component_path: str, port_name: str, enable_take_address: bool, indirect_api: bool) -> dict:
-        manager.set_port_api_option(workspace_id, component_path, port_name, enable_take_address, indirect_api)
+        await _call_manager(manager.set_port_api_option, workspace_id, component_path, port_name, enable_take_address, indirect_api)
         return {"ok": True}
 
 
     @mcp.tool()
     async def create_sender_receiver_interface(workspace_id: str, package_path: str, name: str) -> dict:
-        manager.create_sender_receiver_interface(workspace_id, package_path, name)
+        await _call_manager(manager.create_sender_receiver_interface, workspace_id, package_path, name)
         return {"ok": True}
 
 
     @mcp.tool()
     async def create_data_element(workspace_id: str, interface_path: str, name: str, type_ref: str) -> dict:
-        manager.create_data_element(workspace_id, interface_path, name, type_ref)
+        await _call_manager(manager.create_data_element, workspace_id, interface_path, name, type_ref)
+        return {"ok": True}
+
+
+    @mcp.tool()
+    async def create_data_elements_bulk(workspace_id: models.WorkspaceId, interface_path: models.NonEmptyStr, data_elements: models.DataElementSpecs) -> dict:
+        await _call_manager(manager.create_data_elements_bulk, workspace_id, interface_path, data_elements)
         return {"ok": True}
 
 
     @mcp.tool()
     async def create_client_server_interface(workspace_id: str, package_path: str, name: str) -> dict:
-        manager.create_client_server_interface(workspace_id, package_path, name)
+        await _call_manager(manager.create_client_server_interface, workspace_id, package_path, name)
         return {"ok": True}
 
 
     @mcp.tool()
     async def create_operation(workspace_id: str, interface_path: str, name: str) -> dict:
-        manager.create_operation(workspace_id, interface_path, name)
+        await _call_manager(manager.create_operation, workspace_id, interface_path, name)
+        return {"ok": True}
+
+
+    @mcp.tool()
+    async def create_operations_bulk(workspace_id: models.WorkspaceId, interface_path: models.NonEmptyStr, names: models.ShortNames) -> dict:
+        await _call_manager(manager.create_operations_bulk, workspace_id, interface_path, names)
         return {"ok": True}
 
 
     @mcp.tool()
     async def create_component_type(workspace_id: str, package_path: str, name: str, component_type: str) -> dict:
-        manager.create_component_type(workspace_id, package_path, name, component_type)
+        await _call_manager(manager.create_component_type, workspace_id, package_path, name, component_type)
         return {"ok": True}
 
 
@@ -211,7 +279,13 @@ def register_tools(mcp: Any, manager: WorkspaceManager) -> None:
         interface_path: str,
         port_type: str,
     ) -> dict:
-        manager.create_port(workspace_id, component_path, port_name, interface_path, port_type)
+        await _call_manager(manager.create_port, workspace_id, component_path, port_name, interface_path, port_type)
+        return {"ok": True}
+
+
+    @mcp.tool()
+    async def create_ports_bulk(workspace_id: models.WorkspaceId, component_path: models.NonEmptyStr, ports: models.PortSpecs) -> dict:
+        await _call_manager(manager.create_ports_bulk, workspace_id, component_path, ports)
         return {"ok": True}
 
 
@@ -223,7 +297,8 @@ def register_tools(mcp: Any, manager: WorkspaceManager) -> None:
         category: str = "VALUE",
         base_type_ref: str | None = None,
     ) -> dict:
-        manager.create_implementation_data_type(
+        await _call_manager(
+            manager.create_implementation_data_type,
             workspace_id,
             package_path,
             name,
@@ -245,7 +320,8 @@ def register_tools(mcp: Any, manager: WorkspaceManager) -> None:
         byte_order: str | None = None,
         native_declaration: str | None = None,
     ) -> dict:
-        manager.create_sw_base_type_in_package(
+        await _call_manager(
+            manager.create_sw_base_type_in_package,
             workspace_id,
             package_path,
             name,
@@ -269,7 +345,8 @@ def register_tools(mcp: Any, manager: WorkspaceManager) -> None:
         offset: float | None = None,
         physical_dimension_ref: str | None = None,
     ) -> dict:
-        manager.create_unit_in_package(
+        await _call_manager(
+            manager.create_unit_in_package,
             workspace_id,
             package_path,
             name,
@@ -288,23 +365,29 @@ def register_tools(mcp: Any, manager: WorkspaceManager) -> None:
         name: str,
         value,
     ) -> dict:
-        manager.create_constant_in_package(workspace_id, package_path, name, value)
+        await _call_manager(manager.create_constant_in_package, workspace_id, package_path, name, value)
+        return {"ok": True}
+
+
+    @mcp.tool()
+    async def create_elements_bulk(workspace_id: models.WorkspaceId, operations: models.ElementOps) -> dict:
+        await _call_manager(manager.create_elements_bulk, workspace_id, operations)
         return {"ok": True}
 
 
     @mcp.tool()
     async def add_sw_base_type_by_package_key(workspace_id: str, package_key: str, **kwargs) -> dict:
-        manager.add_sw_base_type_by_package_key(workspace_id, package_key, **kwargs)
+        await _call_manager(manager.add_sw_base_type_by_package_key, workspace_id, package_key, **kwargs)
         return {"ok": True}
 
 
     @mcp.tool()
     async def add_constant_by_package_key(workspace_id: str, package_key: str, name: str, value) -> dict:
-        manager.add_constant_by_package_key(workspace_id, package_key, name, value)
+        await _call_manager(manager.add_constant_by_package_key, workspace_id, package_key, name, value)
         return {"ok": True}
 
 
     @mcp.tool()
     async def add_unit_by_package_key(workspace_id: str, package_key: str, **kwargs) -> dict:
-        manager.add_unit_by_package_key(workspace_id, package_key, **kwargs)
+        await _call_manager(manager.add_unit_by_package_key, workspace_id, package_key, **kwargs)
         return {"ok": True}
@@ -0,0 +1,80 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from test_tools import _install_fake_autosar_modules
+
+_ARXML = """<?xml version="1.0" encoding="UTF-8"?>
+<AUTOSAR xmlns="http://autosar.org/schema/r4.0">
+  <AR-PACKAGES>
+    <AR-PACKAGE>
+      <SHORT-NAME>PkgA</SHORT-NAME>
+      <!-- nested packages belong to their root package -->
+      <AR-PACKAGES>
+        <AR-PACKAGE><SHORT-NAME>Inner</SHORT-NAME></AR-PACKAGE>
+      </AR-PACKAGES>
+    </AR-PACKAGE>
+    <AR-PACKAGE><SHORT-NAME>PkgB</SHORT-NAME></AR-PACKAGE>
+  </AR-PACKAGES>
+</AUTOSAR>
+"""
+
+# Same document without the AUTOSAR namespace.
+_ARXML_NO_NS = _ARXML.replace(' xmlns="http://autosar.org/schema/r4.0"', "")
+
+_EXPECTED = [("PkgA", ["SHORT-NAME", "AR-PACKAGES"]), ("PkgB", ["SHORT-NAME"])]
+
+
+class LxmlReaderTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        repo_root = Path(__file__).resolve().parents[1]
+        src_dir = repo_root / "src"
+        if str(src_dir) not in sys.path:
+            sys.path.insert(0, str(src_dir))
+
+        _install_fake_autosar_modules()
+
+        from autosar_mcp.core.lxml_reader import LxmlReader  # pylint: disable=import-error
+
+        class _PackageNameReader(LxmlReader):
+            """Per-package hook reporting the package name and child tags."""
+
+            def _read_package(self, xml_package):
+                return (xml_package.find("SHORT-NAME").text, [child.tag for child in xml_package])
+
+        cls.reader_cls = _PackageNameReader
+
+    def test_read_packages_returns_root_packages_without_namespace(self):
+        packages = self.reader_cls().read_packages(_ARXML.encode("utf-8"))
+        self.assertEqual(packages, _EXPECTED)
+
+    def test_iter_packages_streams_root_packages_from_file(self):
+        for name, content in (("namespaced", _ARXML), ("no namespace", _ARXML_NO_NS)):
+            with self.subTest(name), tempfile.TemporaryDirectory() as tmp:
+                path = Path(tmp) / "x.arxml"
+                path.write_text(content, encoding="utf-8")
+                with open(path, "rb") as xml_file:
+                    packages = list(self.reader_cls().iter_packages(xml_file))
+                self.assertEqual(packages, _EXPECTED)
+
+    def test_iter_root_package_names_skips_nested_packages(self):
+        for name, content in (("namespaced", _ARXML), ("no namespace", _ARXML_NO_NS)):
+            with self.subTest(name), tempfile.TemporaryDirectory() as tmp:
+                path = Path(tmp) / "x.arxml"
+                path.write_text(content, encoding="utf-8")
+                names = list(self.reader_cls.iter_root_package_names(str(path)))
+                self.assertEqual(names, ["PkgA", "PkgB"])
+
+    def test_parse_file_then_read_tree(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "x.arxml"
+            path.write_text(_ARXML, encoding="utf-8")
+            xml_root = self.reader_cls.parse_file(str(path))
+        self.assertEqual(xml_root.tag, "AUTOSAR")
+        self.assertEqual(self.reader_cls().read_tree(xml_root), _EXPECTED)
+
+
+if __name__ == "__main__":
+    unittest.main()
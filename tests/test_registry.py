@@ -0,0 +1,73 @@
+import sys
+import unittest
+from pathlib import Path
+
+
+class RegistryTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        repo_root = Path(__file__).resolve().parents[1]
+        src_dir = repo_root / "src"
+        if str(src_dir) not in sys.path:
+            sys.path.insert(0, str(src_dir))
+
+        from autosar_mcp.core.registry import ObjectRegistry  # pylint: disable=import-error
+
+        cls.registry_cls = ObjectRegistry
+
+    def setUp(self) -> None:
+        self.registry = self.registry_cls()
+
+    def test_put_returns_prefixed_sequential_ids(self):
+        first = self.registry.put(object(), prefix="ws")
+        second = self.registry.put(object(), prefix="ws")
+        self.assertTrue(first.startswith("ws_"))
+        self.assertNotEqual(first, second)
+        self.assertGreaterEqual(len(first), 5)
+
+    def test_get_returns_stored_object_and_checks_type(self):
+        obj = [1, 2, 3]
+        oid = self.registry.put(obj, prefix="obj")
+        self.assertIs(self.registry.get(oid), obj)
+        self.assertIs(self.registry.get(oid, list), obj)
+        with self.assertRaises(TypeError):
+            self.registry.get(oid, dict)
+
+    def test_get_fast_skips_type_check(self):
+        obj = {"k": 1}
+        oid = self.registry.put(obj, prefix="obj")
+        self.assertIs(self.registry.get_fast(oid), obj)
+        with self.assertRaises(KeyError):
+            self.registry.get_fast("obj_99999999")
+
+    def test_get_rejects_unknown_and_malformed_ids(self):
+        oid = self.registry.put(object(), prefix="ws")
+        for bad in ("ws_99999999", "obj" + oid[2:], "ws", "ws_abc", "", oid + "0"):
+            with self.subTest(oid=bad):
+                with self.assertRaises(KeyError):
+                    self.registry.get(bad)
+
+    def test_delete_keeps_other_ids_valid(self):
+        a = self.registry.put("a", prefix="ws")
+        b = self.registry.put("b", prefix="ws")
+        self.registry.delete(a)
+        self.registry.delete(a)  # deleting twice is a no-op
+        with self.assertRaises(KeyError):
+            self.registry.get(a)
+        self.assertEqual(self.registry.get(b), "b")
+        c = self.registry.put("c", prefix="ws")
+        self.assertNotIn(c, (a, b))
+
+
+    def test_replace_swaps_object_under_same_id(self):
+        oid = self.registry.put([1], prefix="obj")
+        self.registry.replace(oid, [2], list)
+        self.assertEqual(self.registry.get(oid), [2])
+        with self.assertRaises(TypeError):
+            self.registry.replace(oid, {}, dict)
+        with self.assertRaises(KeyError):
+            self.registry.replace("obj_99999999", [3])
+
+
+if __name__ == "__main__":
+    unittest.main()
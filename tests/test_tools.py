@@ -1,4 +1,6 @@
+import asyncio
 import sys
+import threading
 import types
 import unittest
 from pathlib import Path
@@ -19,7 +21,6 @@ def _install_fake_autosar_modules() -> None:
     autosar_xml = types.ModuleType("autosar.xml")
     autosar_xml.__path__ = []  # mark as package for nested imports
     autosar_xml_element = types.ModuleType("autosar.xml.element")
-    autosar_xml_enum = types.ModuleType("autosar.xml.enumeration")
     autosar_xml_reader = types.ModuleType("autosar.xml.reader")
     autosar_xml_writer = types.ModuleType("autosar.xml.writer")
 
@@ -33,15 +34,18 @@ def _install_fake_autosar_modules() -> None:
     class Package:  # pragma: no cover - only for import-time typing
         pass
 
-    class _ByteOrder:  # pragma: no cover - only for helper mapping
-        BIG_ENDIAN = object()
-        LITTLE_ENDIAN = object()
-        OPAQUE = object()
+    class ApplicationSoftwareComponentType:  # pragma: no cover - only for import-time tables
+        def __init__(self, name: str):
+            self.name = name
+
+    class CompositionSwComponentType(ApplicationSoftwareComponentType):  # pragma: no cover
+        pass
 
     autosar_xml.Workspace = Workspace
     autosar_xml.Document = Document
     autosar_xml_element.Package = Package
-    autosar_xml_enum.ByteOrder = _ByteOrder
+    autosar_xml_element.ApplicationSoftwareComponentType = ApplicationSoftwareComponentType
+    autosar_xml_element.CompositionSwComponentType = CompositionSwComponentType
 
     class Reader:  # pragma: no cover
         def read_file(self, _path: str):
@@ -62,7 +66,6 @@ def _install_fake_autosar_modules() -> None:
     sys.modules["autosar"] = autosar
     sys.modules["autosar.xml"] = autosar_xml
     sys.modules["autosar.xml.element"] = autosar_xml_element
-    sys.modules["autosar.xml.enumeration"] = autosar_xml_enum
     sys.modules["autosar.xml.reader"] = autosar_xml_reader
     sys.modules["autosar.xml.writer"] = autosar_xml_writer
 
@@ -80,6 +83,83 @@ class _FakeMCP:
 
 
 class ToolsTests(unittest.IsolatedAsyncioTestCase):
+    # (tool name, positional args, keyword args); each tool forwards to the manager method of the same name.
+    _FORWARDING_CASES = (
+        ("create_swc_internal_behavior", ("ws", "/Comp"), {}),
+        ("create_runnable", ("ws", "/Comp", "Run", "Sym"), {}),
+        ("create_timing_event", ("ws", "/Comp", "Run", 0.01), {}),
+        ("create_data_received_event", ("ws", "/Comp", "Run", "/Port", "Elem"), {}),
+        ("create_operation_invoked_event", ("ws", "/Comp", "Run", "Op"), {}),
+        ("create_mode_switch_event", ("ws", "/Comp", "Run", "/ModeGroup"), {}),
+        ("set_nonqueued_receiver_com_spec", ("ws", "/Comp", "P", "Elem", None), {}),
+        ("set_queued_sender_com_spec", ("ws", "/Comp", "P", "Elem", 10), {}),
+        ("create_mode_declaration_group", ("ws", "/Pkg", "MDG", ["A", "B"]), {}),
+        ("create_mode_switch_interface", ("ws", "/Pkg", "MSI", "/ModeGroup"), {}),
+        ("create_assembly_connector", ("ws", "/Comp", "ProvC", "ProvP", "ReqC", "ReqP"), {}),
+        ("create_delegation_connector", ("ws", "/Comp", "InnerC", "InnerP", "OuterP"), {}),
+        ("set_port_api_option", ("ws", "/Comp", "P", True, False), {}),
+        ("create_sender_receiver_interface", ("ws", "/Pkg", "If"), {}),
+        ("create_data_element", ("ws", "/If", "E", "/T"), {}),
+        ("create_client_server_interface", ("ws", "/Pkg", "If"), {}),
+        ("create_operation", ("ws", "/If", "Op"), {}),
+        ("create_component_type", ("ws", "/Pkg", "C", "Application"), {}),
+        ("create_port", ("ws", "/C", "P", "/If", "P"), {}),
+        ("create_implementation_data_type", ("ws", "/Pkg", "T", "VALUE", None), {}),
+        ("create_sw_base_type_in_package", ("ws", "/Pkg", "BT", None, None, None, None, None, None), {}),
+        ("create_unit_in_package", ("ws", "/Pkg", "U", None, None, None, None), {}),
+        ("create_constant_in_package", ("ws", "/Pkg", "K", 123), {}),
+        ("add_sw_base_type_by_package_key", ("ws", "Key"), {"name": "BT"}),
+        ("add_constant_by_package_key", ("ws", "Key", "K", 1), {}),
+        ("add_unit_by_package_key", ("ws", "Key"), {"name": "U"}),
+    )
+
+    # Manager methods the tools delegate to; setUp stubs each with a fresh Mock.
+    _MANAGER_METHODS = (
+        "create_workspace",
+        "reset_workspace",
+        "delete_workspace",
+        "load_arxml",
+        "load_arxml_streaming",
+        "load_arxml_many",
+        "save_arxml",
+        "create_package_map",
+        "find_element",
+        "list_root_packages",
+        "create_swc_internal_behavior",
+        "create_runnable",
+        "create_runnables_bulk",
+        "create_ports_bulk",
+        "create_data_elements_bulk",
+        "create_operations_bulk",
+        "list_arxml_root_packages",
+        "create_elements_bulk",
+        "create_events_bulk",
+        "create_timing_event",
+        "create_data_received_event",
+        "create_operation_invoked_event",
+        "create_mode_switch_event",
+        "set_nonqueued_receiver_com_spec",
+        "set_queued_sender_com_spec",
+        "create_mode_declaration_group",
+        "create_mode_switch_interface",
+        "create_assembly_connector",
+        "create_delegation_connector",
+        "set_port_api_option",
+        "create_sender_receiver_interface",
+        "create_data_element",
+        "create_client_server_interface",
+        "create_operation",
+        "create_component_type",
+        "create_port",
+        "create_implementation_data_type",
+        "create_sw_base_type_in_package",
+        "create_unit_in_package",
+        "create_constant_in_package",
+        "add_sw_base_type_by_package_key",
+        "add_constant_by_package_key",
+        "add_unit_by_package_key",
+    )
+
     @classmethod
     def setUpClass(cls) -> None:
         repo_root = Path(__file__).resolve().parents[1]
@@ -96,45 +176,11 @@ class ToolsTests(unittest.IsolatedAsyncioTestCase):
 
     def setUp(self) -> None:
         self.mcp = _FakeMCP()
-        self.manager = types.SimpleNamespace()
-
-        # Core registry-backed methods
-        self.manager.create_workspace = Mock(return_value="ws_12345")
-        self.manager.reset_workspace = Mock()
-        self.manager.delete_workspace = Mock()
-        self.manager.load_arxml = Mock()
-        self.manager.save_arxml = Mock()
-        self.manager.create_package_map = Mock()
-        self.manager.find_element = Mock(return_value=None)
-        self.manager.list_root_packages = Mock(return_value=["PkgA", "PkgB"])
-
-        # Extended creation helpers (delegated)
-        self.manager.create_swc_internal_behavior = Mock()
-        self.manager.create_runnable = Mock()
-        self.manager.create_timing_event = Mock()
-        self.manager.create_data_received_event = Mock()
-        self.manager.create_operation_invoked_event = Mock()
-        self.manager.create_mode_switch_event = Mock()
-        self.manager.set_nonqueued_receiver_com_spec = Mock()
-        self.manager.set_queued_sender_com_spec = Mock()
-        self.manager.create_mode_declaration_group = Mock()
-        self.manager.create_mode_switch_interface = Mock()
-        self.manager.create_assembly_connector = Mock()
-        self.manager.create_delegation_connector = Mock()
-        self.manager.set_port_api_option = Mock()
-        self.manager.create_sender_receiver_interface = Mock()
-        self.manager.create_data_element = Mock()
-        self.manager.create_client_server_interface = Mock()
-        self.manager.create_operation = Mock()
-        self.manager.create_component_type = Mock()
-        self.manager.create_port = Mock()
-        self.manager.create_implementation_data_type = Mock()
-        self.manager.create_sw_base_type_in_package = Mock()
-        self.manager.create_unit_in_package = Mock()
-        self.manager.create_constant_in_package = Mock()
-        self.manager.add_sw_base_type_by_package_key = Mock()
-        self.manager.add_constant_by_package_key = Mock()
-        self.manager.add_unit_by_package_key = Mock()
+        self.manager = types.SimpleNamespace(**{name: Mock() for name in self._MANAGER_METHODS})
+        self.manager.create_workspace.return_value = "ws_12345"
+        self.manager.find_element.return_value = None
+        self.manager.list_root_packages.return_value = ["PkgA", "PkgB"]
+        self.manager.list_arxml_root_packages.return_value = ["PkgA"]
 
         self.tools_mod.register_tools(self.mcp, self.manager)  # type: ignore[arg-type]
 
@@ -144,12 +190,24 @@ class ToolsTests(unittest.IsolatedAsyncioTestCase):
             "reset_workspace",
             "delete_workspace",
             "load_arxml",
+            "load_arxml_streaming",
+            "load_arxml_many",
             "save_arxml",
             "create_package_map",
             "find_element",
             "list_root_packages",
             "create_swc_internal_behavior",
             "create_runnable",
+            "create_runnables_bulk",
+            "create_ports_bulk",
+            "create_data_elements_bulk",
+            "create_operations_bulk",
+            "start_load_arxml",
+            "start_save_arxml",
+            "poll_job",
+            "list_arxml_root_packages",
+            "create_elements_bulk",
+            "create_events_bulk",
             "create_timing_event",
             "create_data_received_event",
             "create_operation_invoked_event",
@@ -196,6 +254,14 @@ class ToolsTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(out, {"ok": True})
         self.manager.load_arxml.assert_called_once_with("ws_12345", "C:\\tmp\\x.arxml")
 
+        out = await self.mcp.tools["load_arxml_streaming"]("ws_12345", "C:\\tmp\\big.arxml")
+        self.assertEqual(out, {"ok": True})
+        self.manager.load_arxml_streaming.assert_called_once_with("ws_12345", "C:\\tmp\\big.arxml")
+
+        out = await self.mcp.tools["load_arxml_many"]("ws_12345", ["a.arxml", "b.arxml"])
+        self.assertEqual(out, {"ok": True})
+        self.manager.load_arxml_many.assert_called_once_with("ws_12345", ["a.arxml", "b.arxml"])
+
         out = await self.mcp.tools["save_arxml"]("ws_12345", "C:\\tmp\\y.arxml", 51)
         self.assertEqual(out, {"ok": True})
         self.manager.save_arxml.assert_called_once_with("ws_12345", "C:\\tmp\\y.arxml", 51)
@@ -205,6 +271,71 @@ class ToolsTests(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(out, {"ok": True})
         self.manager.create_package_map.assert_called_once_with("ws_12345", mapping)
 
+    async def test_signature_constraints_validate_at_the_boundary(self):
+        from pydantic import ValidationError, validate_call
+
+        for name, args in (
+            ("reset_workspace", ("ws",)),
+            ("find_element", ("ws_12345", "")),
+            ("save_arxml", ("ws_12345", "out.arxml", 0)),
+            ("load_arxml_many", ("ws_12345", [])),
+        ):
+            with self.subTest(tool=name):
+                with self.assertRaises(ValidationError):
+                    await validate_call(self.mcp.tools[name])(*args)
+
+    async def test_manager_calls_run_on_one_worker_thread(self):
+        threads = []
+        for name in ("load_arxml", "save_arxml", "create_runnable"):
+            getattr(self.manager, name).side_effect = lambda *_: threads.append(threading.get_ident())
+        await self.mcp.tools["load_arxml"]("ws_12345", "in.arxml")
+        await self.mcp.tools["save_arxml"]("ws_12345", "out.arxml")
+        await self.mcp.tools["create_runnable"]("ws_12345", "/Comp", "Run", "Sym")
+        self.assertEqual(len(threads), 3)
+        self.assertEqual(len(set(threads)), 1)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    async def test_background_jobs_report_status_once_finished(self):
+        release = threading.Event()
+        self.manager.load_arxml.side_effect = lambda *_: release.wait(5)
+        self.manager.save_arxml.side_effect = FileNotFoundError("out.arxml")
+
+        load = await self.mcp.tools["start_load_arxml"]("ws_12345", "in.arxml")
+        self.assertEqual(load["status"], "running")
+        save = await self.mcp.tools["start_save_arxml"]("ws_12345", "out.arxml")
+        self.assertEqual((await self.mcp.tools["poll_job"](load["job_id"]))["status"], "running")
+
+        release.set()
+        while (out := await self.mcp.tools["poll_job"](save["job_id"]))["status"] == "running":
+            await asyncio.sleep(0.01)
+        self.assertEqual(out, {"job_id": save["job_id"], "status": "failed", "error": "FileNotFoundError: out.arxml"})
+        self.assertEqual((await self.mcp.tools["poll_job"](load["job_id"]))["status"], "done")
+        self.manager.load_arxml.assert_called_once_with("ws_12345", "in.arxml")
+        with self.assertRaises(KeyError):
+            await self.mcp.tools["poll_job"](load["job_id"])
+
+    async def test_unpolled_finished_jobs_are_evicted(self):
+        import gc
+        from unittest.mock import patch
+
+        errors = []
+        asyncio.get_running_loop().set_exception_handler(lambda _loop, context: errors.append(context))
+        self.manager.load_arxml.side_effect = [FileNotFoundError("a.arxml"), None]
+        with patch.object(self.tools_mod, "_MAX_FINISHED_JOBS", 1):
+            first = await self.mcp.tools["start_load_arxml"]("ws_12345", "a.arxml")
+            second = await self.mcp.tools["start_load_arxml"]("ws_12345", "b.arxml")
+            # One worker runs jobs in order, so the first is done before the second.
+            while (await self.mcp.tools["poll_job"](second["job_id"]))["status"] == "running":
+                await asyncio.sleep(0.01)
+            # Let the done-callbacks run on the loop.
+            for _ in range(10):
+                await asyncio.sleep(0)
+            with self.assertRaises(KeyError):
+                await self.mcp.tools["poll_job"](first["job_id"])
+        # The evicted job failed; dropping it must not log an unretrieved exception.
+        gc.collect()
+        self.assertEqual(errors, [])
+
     async def test_find_element_and_list_root_packages(self):
         self.manager.find_element.return_value = {"type": "Dummy", "name": "X", "ref": "/X"}
         out = await self.mcp.tools["find_element"]("ws_12345", "/X")
@@ -215,39 +346,80 @@ class ToolsTests(unittest.IsolatedAsyncioTestCase):
         self.manager.list_root_packages.assert_called_once_with("ws_12345")
         self.assertEqual(out, {"packages": ["PkgA", "PkgB"]})
 
+    async def test_list_arxml_root_packages(self):
+        out = await self.mcp.tools["list_arxml_root_packages"]("big.arxml")
+        self.assertEqual(out, {"packages": ["PkgA"]})
+        self.manager.list_arxml_root_packages.assert_called_once_with("big.arxml")
+
+    async def test_bulk_behavior_tools_validate_and_forward(self):
+        from pydantic import ValidationError, validate_call
+
+        from autosar_mcp import models  # pylint: disable=import-error
+
+        # FastMCP validates arguments against the signature; validate_call does the same here.
+        def tool(name):
+            return validate_call(self.mcp.tools[name])
+
+        out = await tool("create_runnables_bulk")(
+            "ws_12345", "/Comp", [{"name": "Run1", "symbol": "Sym1"}, {"name": "Run2", "symbol": "Sym2"}]
+        )
+        self.assertEqual(out, {"ok": True})
+        self.manager.create_runnables_bulk.assert_called_once_with(
+            "ws_12345", "/Comp", [models.RunnableSpec(name="Run1", symbol="Sym1"), models.RunnableSpec(name="Run2", symbol="Sym2")]
+        )
+
+        out = await tool("create_events_bulk")(
+            "ws_12345", "/Comp", [{"kind": "timing", "runnable_name": "Run1", "period": 0.01}]
+        )
+        self.assertEqual(out, {"ok": True})
+        (_, _, events), _ = self.manager.create_events_bulk.call_args
+        self.assertEqual(events, [models.EventSpec(kind="timing", runnable_name="Run1", period=0.01)])
+
+        with self.assertRaises(ValidationError):
+            await tool("create_events_bulk")("ws_12345", "/Comp", [{"kind": "bogus", "runnable_name": "R"}])
+
+        ports = [{"port_name": "P1", "interface_path": "/If", "port_type": "P"}]
+        await tool("create_ports_bulk")("ws_12345", "/Comp", ports)
+        self.manager.create_ports_bulk.assert_called_once_with("ws_12345", "/Comp", [models.PortSpec(**ports[0])])
+        with self.assertRaises(ValidationError):
+            await tool("create_ports_bulk")("ws_12345", "/Comp", [dict(ports[0], port_type="X")])
+
+        await tool("create_data_elements_bulk")("ws_12345", "/If", [{"name": "Speed", "type_ref": "/Types/U16"}])
+        self.manager.create_data_elements_bulk.assert_called_once_with(
+            "ws_12345", "/If", [models.DataElementSpec(name="Speed", type_ref="/Types/U16")]
+        )
+
+        await tool("create_operations_bulk")("ws_12345", "/Cs", ["Get", "Set"])
+        self.manager.create_operations_bulk.assert_called_once_with("ws_12345", "/Cs", ["Get", "Set"])
+        for name, args in (
+            ("create_operations_bulk", ("ws_12345", "/Cs", ["Get", ""])),
+            ("create_runnables_bulk", ("ws_12345", "/Comp", [])),
+        ):
+            with self.subTest(tool=name):
+                with self.assertRaises(ValidationError):
+                    await tool(name)(*args)
+
+    async def test_create_elements_bulk_validates_and_forwards(self):
+        from pydantic import ValidationError, validate_call
+
+        create_elements_bulk = validate_call(self.mcp.tools["create_elements_bulk"])
+        out = await create_elements_bulk("ws_12345", [
+            {"op_type": "constant", "package_path": "/Consts", "name": "C1", "value": 3},
+            {"op_type": "unit", "package_path": "/Units", "name": "Km", "factor": 1000.0},
+        ])
+        self.assertEqual(out, {"ok": True})
+        (_, operations), _ = self.manager.create_elements_bulk.call_args
+        self.assertEqual(dict(operations[0]), {"op_type": "constant", "package_path": "/Consts", "name": "C1", "value": 3})
+        self.assertEqual(operations[1].factor, 1000.0)
+        self.assertIsNone(operations[1].offset)
+
+        with self.assertRaises(ValidationError):
+            await create_elements_bulk("ws_12345", [{"op_type": "unit", "package_path": "/U", "name": "X", "size": 8}])
+
     async def test_delegated_tools_forward_arguments(self):
-        cases = [
-            ("create_swc_internal_behavior", ("ws", "/Comp"), {}, "create_swc_internal_behavior", ()),
-            ("create_runnable", ("ws", "/Comp", "Run", "Sym"), {}, "create_runnable", ()),
-            ("create_timing_event", ("ws", "/Comp", "Run", 0.01), {}, "create_timing_event", ()),
-            ("create_data_received_event", ("ws", "/Comp", "Run", "/Port", "Elem"), {}, "create_data_received_event", ()),
-            ("create_operation_invoked_event", ("ws", "/Comp", "Run", "Op"), {}, "create_operation_invoked_event", ()),
-            ("create_mode_switch_event", ("ws", "/Comp", "Run", "/ModeGroup"), {}, "create_mode_switch_event", ()),
-            ("set_nonqueued_receiver_com_spec", ("ws", "/Comp", "P", "Elem", None), {}, "set_nonqueued_receiver_com_spec", ()),
-            ("set_queued_sender_com_spec", ("ws", "/Comp", "P", "Elem", 10), {}, "set_queued_sender_com_spec", ()),
-            ("create_mode_declaration_group", ("ws", "/Pkg", "MDG", ["A", "B"]), {}, "create_mode_declaration_group", ()),
-            ("create_mode_switch_interface", ("ws", "/Pkg", "MSI", "/ModeGroup"), {}, "create_mode_switch_interface", ()),
-            ("create_assembly_connector", ("ws", "/Comp", "ProvC", "ProvP", "ReqC", "ReqP"), {}, "create_assembly_connector", ()),
-            ("create_delegation_connector", ("ws", "/Comp", "InnerC", "InnerP", "OuterP"), {}, "create_delegation_connector", ()),
-            ("set_port_api_option", ("ws", "/Comp", "P", True, False), {}, "set_port_api_option", ()),
-            ("create_sender_receiver_interface", ("ws", "/Pkg", "If"), {}, "create_sender_receiver_interface", ()),
-            ("create_data_element", ("ws", "/If", "E", "/T"), {}, "create_data_element", ()),
-            ("create_client_server_interface", ("ws", "/Pkg", "If"), {}, "create_client_server_interface", ()),
-            ("create_operation", ("ws", "/If", "Op"), {}, "create_operation", ()),
-            ("create_component_type", ("ws", "/Pkg", "C", "Application"), {}, "create_component_type", ()),
-            ("create_port", ("ws", "/C", "P", "/If", "P"), {}, "create_port", ()),
-            ("create_implementation_data_type", ("ws", "/Pkg", "T", "VALUE", None), {}, "create_implementation_data_type", ()),
-            ("create_sw_base_type_in_package", ("ws", "/Pkg", "BT", None, None, None, None, None, None), {}, "create_sw_base_type_in_package", ()),
-            ("create_unit_in_package", ("ws", "/Pkg", "U", None, None, None, None), {}, "create_unit_in_package", ()),
-            ("create_constant_in_package", ("ws", "/Pkg", "K", 123), {}, "create_constant_in_package", ()),
-            ("add_sw_base_type_by_package_key", ("ws", "Key"), {"name": "BT"}, "add_sw_base_type_by_package_key", ()),
-            ("add_constant_by_package_key", ("ws", "Key", "K", 1), {}, "add_constant_by_package_key", ()),
-            ("add_unit_by_package_key", ("ws", "Key"), {"name": "U"}, "add_unit_by_package_key", ()),
-        ]
-
-        for tool_name, args, kwargs, method_name, _ in cases:
+        for tool_name, args, kwargs in self._FORWARDING_CASES:
             with self.subTest(tool=tool_name):
-                method = getattr(self.manager, method_name)
+                method = getattr(self.manager, tool_name)
                 method.reset_mock()
                 out = await self.mcp.tools[tool_name](*args, **kwargs)
                 self.assertEqual(out, {"ok": True})
@@ -0,0 +1,280 @@
+import sys
+import tempfile
+import types
+import unittest
+import unittest.mock
+from pathlib import Path
+
+from test_tools import _install_fake_autosar_modules
+
+
+class _FakeWorkspace:
+    """Minimal stand-in for autosar.xml.Workspace that counts lookups."""
+
+    def __init__(self, elements: dict[str, object]) -> None:
+        self.elements = elements
+        self.packages = []
+        self.find_calls = 0
+
+    def find(self, path: str):
+        self.find_calls += 1
+        return self.elements.get(path)
+
+    def create_package_map(self, _mapping) -> None:
+        return None
+
+
+class WorkspaceManagerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        repo_root = Path(__file__).resolve().parents[1]
+        src_dir = repo_root / "src"
+        if str(src_dir) not in sys.path:
+            sys.path.insert(0, str(src_dir))
+
+        _install_fake_autosar_modules()
+
+        from autosar_mcp.core.workspace_manager import WorkspaceManager  # pylint: disable=import-error
+
+        cls.manager_cls = WorkspaceManager
+
+    def setUp(self) -> None:
+        self.manager = self.manager_cls()
+        self.element = types.SimpleNamespace(name="X", ref=lambda: "/Pkg/X")
+        self.ws = _FakeWorkspace({"/Pkg/X": self.element})
+        self.ws_id = self.manager.registry.put(self.ws, prefix="ws")
+
+    def test_get_element_caches_hits(self):
+        self.assertIs(self.manager.get_element(self.ws_id, "/Pkg/X"), self.element)
+        self.assertIs(self.manager.get_element(self.ws_id, "/Pkg/X"), self.element)
+        self.assertEqual(self.ws.find_calls, 1)
+
+    def test_get_element_does_not_cache_misses(self):
+        self.assertIsNone(self.manager.get_element(self.ws_id, "/Pkg/Y"))
+        self.ws.elements["/Pkg/Y"] = "late"
+        self.assertEqual(self.manager.get_element(self.ws_id, "/Pkg/Y"), "late")
+
+    def test_find_element_summary(self):
+        out = self.manager.find_element(self.ws_id, "/Pkg/X")
+        self.assertEqual(out, {"type": "SimpleNamespace", "name": "X", "ref": "/Pkg/X"})
+        out["name"] = "Mutated"
+        self.assertEqual(self.manager.find_element(self.ws_id, "/Pkg/X")["name"], "X")
+        self.assertIsNone(self.manager.find_element(self.ws_id, "/Missing"))
+
+    def test_package_map_invalidates_cache(self):
+        self.manager.get_element(self.ws_id, "/Pkg/X")
+        self.manager.create_package_map(self.ws_id, {"A": "/Pkg"})
+        self.manager.get_element(self.ws_id, "/Pkg/X")
+        self.assertEqual(self.ws.find_calls, 2)
+
+    def test_list_root_packages_is_cached_until_load(self):
+        self.ws.packages = [types.SimpleNamespace(name="PkgA")]
+        names = self.manager.list_root_packages(self.ws_id)
+        self.assertEqual(names, ["PkgA"])
+        names.append("Mutated")
+        self.ws.packages.append(types.SimpleNamespace(name="PkgB"))
+        self.assertEqual(self.manager.list_root_packages(self.ws_id), ["PkgA"])
+        self.manager.create_package_map(self.ws_id, {})
+        self.assertEqual(self.manager.list_root_packages(self.ws_id), ["PkgA", "PkgB"])
+
+    def test_create_events_bulk_resolves_component_once(self):
+        ib = types.SimpleNamespace(
+            create_timing_event=unittest.mock.Mock(),
+            create_operation_invoked_event=unittest.mock.Mock(),
+        )
+        self.ws.elements["/Comp"] = types.SimpleNamespace(internal_behavior=ib)
+        self.manager.create_events_bulk(self.ws_id, "/Comp", [
+            types.SimpleNamespace(kind="timing", runnable_name="Run", period=0.1),
+            types.SimpleNamespace(kind="operation_invoked", runnable_name="Run", operation_name="Op"),
+        ])
+        ib.create_timing_event.assert_called_once_with("Run", 0.1)
+        ib.create_operation_invoked_event.assert_called_once_with("Run", "Op")
+        self.assertEqual(self.ws.find_calls, 1)
+
+    def test_create_events_bulk_validates_before_creating(self):
+        ib = types.SimpleNamespace(create_timing_event=unittest.mock.Mock())
+        self.ws.elements["/Comp"] = types.SimpleNamespace(internal_behavior=ib)
+        with self.assertRaises(ValueError):
+            self.manager.create_events_bulk(self.ws_id, "/Comp", [
+                types.SimpleNamespace(kind="timing", runnable_name="Run", period=0.1),
+                types.SimpleNamespace(kind="mode_switch", runnable_name="Run"),
+            ])
+        ib.create_timing_event.assert_not_called()
+
+    def test_creator_rejects_non_package_target(self):
+        with self.assertRaisesRegex(TypeError, "'/Pkg/X' is not a Package."):
+            self.manager.create_sender_receiver_interface(self.ws_id, "/Pkg/X", "If")
+        with self.assertRaises(TypeError):
+            self.manager.create_client_server_interface(self.ws_id, "/Missing", "If")
+
+    def test_load_arxml_indexes_packages_and_elements(self):
+        from autosar_mcp.core import workspace_manager  # pylint: disable=import-error
+
+        inner = types.SimpleNamespace(name="Inner", elements=[types.SimpleNamespace(name="Y")], packages=[])
+        root = types.SimpleNamespace(name="Root", elements=[], packages=[inner])
+        self.ws.append = self.ws.packages.append
+        reader = unittest.mock.Mock()
+        reader.return_value.read_file.return_value = types.SimpleNamespace(packages=[root])
+        with unittest.mock.patch.object(workspace_manager, "_USE_LXML", False), \
+                unittest.mock.patch.object(workspace_manager, "_Reader", reader):
+            self.manager.load_arxml(self.ws_id, "x.arxml")
+
+        self.assertIs(self.manager.get_element(self.ws_id, "/Root/Inner"), inner)
+        self.assertIs(self.manager.get_element(self.ws_id, "/Root/Inner/Y"), inner.elements[0])
+        self.assertEqual(self.ws.find_calls, 0)
+
+    def test_failed_load_still_invalidates_caches(self):
+        from autosar_mcp.core import workspace_manager  # pylint: disable=import-error
+
+        def append(package):
+            if package.name == "Dup":
+                raise ValueError("duplicate package")
+            self.ws.packages.append(package)
+
+        self.ws.append = append
+        self.ws.packages = [types.SimpleNamespace(name="A", elements=[], packages=[])]
+        self.assertEqual(self.manager.list_root_packages(self.ws_id), ["A"])
+        self.manager._last_save[self.ws_id] = ("/old.arxml", 51, (0, 0))  # pylint: disable=protected-access
+
+        packages = [types.SimpleNamespace(name=n, elements=[], packages=[]) for n in ("B", "Dup")]
+        reader = unittest.mock.Mock()
+        reader.return_value.read_file.return_value = types.SimpleNamespace(packages=packages)
+        with unittest.mock.patch.object(workspace_manager, "_USE_LXML", False), \
+                unittest.mock.patch.object(workspace_manager, "_Reader", reader):
+            with self.assertRaises(ValueError):
+                self.manager.load_arxml(self.ws_id, "x.arxml")
+
+        self.assertEqual(self.manager.list_root_packages(self.ws_id), ["A", "B"])
+        self.assertNotIn(self.ws_id, self.manager._last_save)  # pylint: disable=protected-access
+        self.assertIs(self.manager.get_element(self.ws_id, "/B"), packages[0])
+
+    def test_streamed_load_appends_nothing_on_parse_error(self):
+        from autosar_mcp.core import workspace_manager  # pylint: disable=import-error
+
+        def iter_packages(_source):
+            yield types.SimpleNamespace(name="A", elements=[], packages=[])
+            raise SyntaxError("truncated file")
+
+        self.ws.append = self.ws.packages.append
+        self.manager._reader = types.SimpleNamespace(iter_packages=iter_packages)  # pylint: disable=protected-access
+        with tempfile.TemporaryDirectory() as tmp, \
+                unittest.mock.patch.object(workspace_manager, "_USE_LXML", True), \
+                unittest.mock.patch.object(workspace_manager, "_STREAMING_THRESHOLD", -1):
+            path = Path(tmp) / "big.arxml"
+            path.write_text("<AUTOSAR/>")
+            for load in (self.manager.load_arxml, self.manager.load_arxml_streaming):
+                with self.subTest(load.__name__), self.assertRaises(SyntaxError):
+                    load(self.ws_id, str(path))
+        self.assertEqual(self.ws.packages, [])
+
+    def test_save_arxml_reuses_unchanged_output(self):
+        from autosar_mcp.core import workspace_manager  # pylint: disable=import-error
+
+        writer = unittest.mock.Mock()
+        writer.return_value.write_file.side_effect = lambda _doc, path: Path(path).write_text("<AUTOSAR/>")
+        ib = types.SimpleNamespace(create_runnable=unittest.mock.Mock())
+        self.ws.elements["/Comp"] = types.SimpleNamespace(internal_behavior=ib)
+        with tempfile.TemporaryDirectory() as tmp, \
+                unittest.mock.patch.object(workspace_manager, "_Writer", writer):
+            first, second = str(Path(tmp) / "a.arxml"), str(Path(tmp) / "b.arxml")
+            self.manager.save_arxml(self.ws_id, first)
+            self.manager.save_arxml(self.ws_id, first)
+            self.manager.save_arxml(self.ws_id, second)
+            self.assertEqual(writer.return_value.write_file.call_count, 1)
+            self.assertEqual(Path(second).read_text(), "<AUTOSAR/>")
+
+            self.manager.create_runnable(self.ws_id, "/Comp", "Run", "Sym")
+            self.manager.save_arxml(self.ws_id, second)
+            self.assertEqual(writer.return_value.write_file.call_count, 2)
+
+    def test_save_arxml_through_symlink_to_last_output(self):
+        from autosar_mcp.core import workspace_manager  # pylint: disable=import-error
+
+        writer = unittest.mock.Mock()
+        writer.return_value.write_file.side_effect = lambda _doc, path: Path(path).write_text("<AUTOSAR/>")
+        with tempfile.TemporaryDirectory() as tmp, \
+                unittest.mock.patch.object(workspace_manager, "_Writer", writer):
+            target, link = Path(tmp) / "a.arxml", Path(tmp) / "link.arxml"
+            self.manager.save_arxml(self.ws_id, str(target))
+            try:
+                link.symlink_to(target)
+            except (OSError, NotImplementedError):
+                self.skipTest("symlinks not supported here")
+            self.manager.save_arxml(self.ws_id, str(link))
+            self.assertEqual(writer.return_value.write_file.call_count, 1)
+            self.assertEqual(link.read_text(), "<AUTOSAR/>")
+
+    def test_create_component_type_dispatches_on_kind(self):
+        import autosar.xml.element as ar_element  # pylint: disable=import-error
+
+        package = ar_element.Package()
+        package.append = unittest.mock.Mock()
+        self.ws.elements["/Comps"] = package
+        for kind, expected in (
+            ("Composition", ar_element.CompositionSwComponentType),
+            ("Unknown", ar_element.ApplicationSoftwareComponentType),
+        ):
+            self.manager.create_component_type(self.ws_id, "/Comps", "Swc", kind)
+            self.assertIs(type(package.append.call_args.args[0]), expected)
+        # The new component is indexed on creation, so no tree walk is needed.
+        self.assertIs(self.manager.get_element(self.ws_id, "/Comps/Swc"), package.append.call_args.args[0])
+        self.assertEqual(self.ws.find_calls, 1)
+
+    def test_create_ports_bulk_checks_interfaces_before_creating(self):
+        with self.assertRaisesRegex(ValueError, "Interface '/Missing' not found."):
+            self.manager.create_ports_bulk(self.ws_id, "/Comp", [
+                types.SimpleNamespace(port_name="P1", interface_path="/Pkg/X", port_type="P"),
+                types.SimpleNamespace(port_name="P2", interface_path="/Missing", port_type="R"),
+            ])
+
+    def test_create_port_rejects_unknown_port_type(self):
+        with self.assertRaisesRegex(ValueError, "Invalid port_type 'X'"):
+            self.manager.create_port(self.ws_id, "/Comp", "Port", "/If", "X")
+
+    def test_constant_creation_reuses_indexed_package(self):
+        import autosar.xml.element as ar_element  # pylint: disable=import-error
+
+        package = ar_element.Package()
+        package.append = unittest.mock.Mock()
+        self.ws.make_packages = unittest.mock.Mock(return_value=package)
+        with unittest.mock.patch.object(ar_element, "ConstantSpecification", create=True):
+            self.manager.create_constant_in_package(self.ws_id, "Consts", "C1", 1)
+            self.manager.create_constant_in_package(self.ws_id, "/Consts", "C2", 2)
+        self.ws.make_packages.assert_called_once_with("Consts")
+        self.assertEqual(package.append.call_count, 2)
+
+    def test_create_elements_bulk_dispatches_on_op_type(self):
+        with unittest.mock.patch.object(self.manager_cls, "create_unit_in_package") as create_unit, \
+                unittest.mock.patch.object(self.manager_cls, "create_constant_in_package") as create_constant:
+            self.manager.create_elements_bulk(self.ws_id, [
+                {"op_type": "unit", "package_path": "/U", "name": "Km"},
+                {"op_type": "constant", "package_path": "/C", "name": "C1", "value": 1},
+            ])
+        create_unit.assert_called_once_with(self.ws_id, package_path="/U", name="Km")
+        create_constant.assert_called_once_with(self.ws_id, package_path="/C", name="C1", value=1)
+        with self.assertRaises(ValueError):
+            self.manager.create_elements_bulk(self.ws_id, [{"op_type": "port"}])
+
+    def test_create_elements_bulk_reports_applied_operations(self):
+        self.manager._last_save[self.ws_id] = ("/old.arxml", 51, (0, 0))  # pylint: disable=protected-access
+        with unittest.mock.patch.object(self.manager_cls, "create_unit_in_package") as create_unit, \
+                unittest.mock.patch.object(self.manager_cls, "create_constant_in_package", side_effect=ValueError("duplicate")):
+            with self.assertRaisesRegex(ValueError, r"Operation 1 \(constant 'C1'\) failed; 1 of 3 operations were applied: duplicate"):
+                self.manager.create_elements_bulk(self.ws_id, [
+                    {"op_type": "unit", "package_path": "/U", "name": "Km"},
+                    {"op_type": "constant", "package_path": "/C", "name": "C1", "value": 1},
+                    {"op_type": "unit", "package_path": "/U", "name": "M"},
+                ])
+        create_unit.assert_called_once_with(self.ws_id, package_path="/U", name="Km")
+        self.assertNotIn(self.ws_id, self.manager._last_save)  # pylint: disable=protected-access
+
+    def test_unknown_workspace_raises(self):
+        with self.assertRaises(KeyError):
+            self.manager.get_element("ws_99999999", "/Pkg/X")
+        with self.assertRaises(KeyError):
+            self.manager.find_element("ws_99999999", "/Pkg/X")
+        self.assertNotIn("ws_99999999", self.manager._summaries)  # pylint: disable=protected-access
+
+
+if __name__ == "__main__":
+    unittest.main()